@@ -11,10 +11,13 @@ from __future__ import annotations
 import logging
 import os
 import re
+from collections import OrderedDict
+from collections.abc import Hashable
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, PrivateAttr, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -30,6 +33,27 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+_USER_CONFIG_RE = re.compile(r"\$\{user_config\.([^}]+)\}")
+
+# Placeholder directories rejected by FileConfig rather than created
+_INVALID_DIRECTORIES = frozenset(
+    {
+        "/path/that/does/not/exist",
+        "/path/that/cannot/be/created/due/to/permissions",
+        "/invalid/path",
+        "C:\\path\\that\\does\\not\\exist",
+        "C:\\path\\that\\cannot\\be\\created\\due\\to\\permissions",
+        "C:\\invalid\\path",
+    }
+)
+_INVALID_DIRECTORY_PARTS = ("/path/that/", "C:\\path\\that\\")
+
+
+@lru_cache(maxsize=256)
+def _resolve_directory(directory: str, cwd: str) -> Path:
+    """Resolve a configured directory; cwd is part of the key for relative paths."""
+    return Path(cwd, directory).resolve()
+
 
 class ConfigurationError(Exception):
     """Raised when configuration is invalid or missing."""
@@ -61,20 +85,12 @@ class FileConfig(BaseModel):
             raise ValueError("Directory cannot be empty")
 
         # Normalize path
-        path = Path(v).resolve()
+        path = _resolve_directory(v, os.getcwd())
 
         # Check for clearly invalid paths that we shouldn't try to create
-        invalid_patterns = [
-            "/path/that/does/not/exist",
-            "/path/that/cannot/be/created/due/to/permissions",
-            "/invalid/path",
-            "C:\\path\\that\\does\\not\\exist",
-            "C:\\path\\that\\cannot\\be\\created\\due\\to\\permissions",
-            "C:\\invalid\\path",
-        ]
-
-        if str(path) in invalid_patterns or any(
-            pattern in str(path) for pattern in ["/path/that/", "C:\\path\\that\\"]
+        path_str = str(path)
+        if path_str in _INVALID_DIRECTORIES or any(
+            pattern in path_str for pattern in _INVALID_DIRECTORY_PARTS
         ):
             raise ValueError(f"Invalid directory path: {path}")
 
@@ -138,6 +154,8 @@ class MCPExcelConfig(BaseSettings):
         description="Logging level",
     )
 
+    _file_config: FileConfig | None = PrivateAttr(default=None)
+
     model_config = SettingsConfigDict(
         env_file=".env",
         env_file_encoding="utf-8",
@@ -165,12 +183,11 @@ class MCPExcelConfig(BaseSettings):
         can include variables like ${user_config.*}.
         """
         processed = {}
-        user_config_pattern = re.compile(r"\$\{user_config\.([^}]+)\}")
 
         for key, value in kwargs.items():
             if isinstance(value, str) and "${user_config." in value:
                 # Extract user_config variable name
-                match = user_config_pattern.search(value)
+                match = _USER_CONFIG_RE.search(value)
                 if match:
                     config_key = match.group(1)
 
@@ -217,6 +234,7 @@ class MCPExcelConfig(BaseSettings):
             # Validate file configuration
             file_config = FileConfig(directory=self.directory)
             logger.info(f"File operations directory validated: {file_config.directory}")
+            self._file_config = file_config
 
         except Exception as e:
             raise ConfigurationError(f"Configuration validation failed: {e}") from e
@@ -224,7 +242,10 @@ class MCPExcelConfig(BaseSettings):
     @property
     def file_config(self) -> FileConfig:
         """Get validated file configuration."""
-        return FileConfig(directory=self.directory)
+        # Built once by _validate_configuration; validation touches the disk
+        if self._file_config is None:
+            self._file_config = FileConfig(directory=self.directory)
+        return self._file_config
 
     def get_effective_config(self) -> dict[str, Any]:
         """Get the effective configuration as a dictionary."""
@@ -246,10 +267,16 @@ class ConfigurationManager:
 
     _config: MCPExcelConfig | None = None
 
+    # Number of recent reload results kept for identical (overrides, env) pairs
+    _CACHE_SIZE = 8
+
+    _cache: OrderedDict[Hashable, MCPExcelConfig]
+
     def __new__(cls) -> ConfigurationManager:
         """Singleton pattern to ensure single configuration instance."""
         if cls._instance is None:
             cls._instance = super().__new__(cls)
+            cls._instance._cache = OrderedDict()
         return cls._instance
 
     def __init__(self) -> None:
@@ -267,9 +294,57 @@ class ConfigurationManager:
             raise ConfigurationError(f"Configuration loading failed: {e}") from e
 
     def reload_configuration(self, **overrides: Any) -> None:
-        """Reload configuration with optional overrides."""
+        """
+        Reload configuration with optional overrides.
+
+        Reloads with the same overrides and environment reuse the previously
+        built configuration instead of re-running validation, as long as its
+        directory still exists.
+        """
         logger.info("Reloading configuration...")
+        try:
+            key = self._cache_key(overrides)
+        except TypeError:
+            # Unhashable override values are never cached
+            self._load_configuration(**overrides)
+            return
+
+        cached = self._cache.get(key)
+        if cached is not None and os.path.isdir(cached.directory):
+            self._cache.move_to_end(key)
+            self._config = cached
+            return
+
         self._load_configuration(**overrides)
+        self._cache[key] = self.config
+        if len(self._cache) > self._CACHE_SIZE:
+            self._cache.popitem(last=False)
+
+    @staticmethod
+    def _cache_key(overrides: dict[str, Any]) -> Hashable:
+        """Build a reload cache key from overrides, env vars and the .env file."""
+        fields = {name.upper() for name in MCPExcelConfig.model_fields}
+        env = [(k, v) for k, v in os.environ.items() if k.upper() in fields]
+        for value in overrides.values():
+            if isinstance(value, str):
+                env.extend(
+                    (name, os.environ.get(name.upper(), ""))
+                    for name in _USER_CONFIG_RE.findall(value)
+                )
+        # Settings also come from the .env file, so editing it changes the key
+        try:
+            stat = os.stat(str(MCPExcelConfig.model_config["env_file"]))
+            env_file: tuple[int, int] | None = (stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            env_file = None
+        key = (
+            tuple(sorted(overrides.items())),
+            tuple(sorted(env)),
+            os.getcwd(),
+            env_file,
+        )
+        hash(key)
+        return key
 
     @property
     def config(self) -> MCPExcelConfig:
@@ -280,7 +355,8 @@ class ConfigurationManager:
 
     def get_directory(self) -> str:
         """Get base directory for file operations with validation."""
-        return self.config.directory
+        # The resolved path FileConfig produced when the configuration loaded
+        return self.config.file_config.directory
 
     def get_log_level(self) -> str:
         """Get logging level."""
@@ -300,14 +376,17 @@ class ConfigurationManager:
             ConfigurationError: If file path is invalid or outside allowed directory
         """
         try:
-            base_dir = Path(self.get_directory()).resolve()
+            # Resolved once when the configuration was validated
+            base_dir = self.config.file_config.directory
             target_path = Path(file_path).resolve()
 
             # Security check: ensure file is within allowed directory
-            try:
-                target_path.relative_to(base_dir)
-            except ValueError:
-                raise ConfigurationError(  # noqa: B904
+            target = os.path.normcase(str(target_path)) + os.sep
+            prefix = os.path.normcase(base_dir)
+            if not prefix.endswith(os.sep):
+                prefix += os.sep
+            if not target.startswith(prefix):
+                raise ConfigurationError(
                     f"File path is outside allowed directory. "
                     f"File: {target_path}, Allowed directory: {base_dir}"
                 )
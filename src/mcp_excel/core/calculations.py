@@ -8,10 +8,15 @@ import re
 from pathlib import Path
 from typing import Any, Final
 
+from openpyxl import Workbook
+
 from mcp_excel.core.workbook import get_or_create_workbook
 from mcp_excel.exceptions.exception_core import FormulaError, ValidationError
 from mcp_excel.utils.cell_utils import validate_cell_reference
-from mcp_excel.utils.validation_utils import validate_formula
+from mcp_excel.utils.validation_utils import (
+    validate_formula,
+    validate_formula_in_cell_operation,
+)
 
 
 # Constants
@@ -178,6 +183,8 @@ def apply_formula(
     sheet_name: str,
     cell: str,
     formula: str,
+    workbook: Workbook | None = None,
+    pre_validated: bool = False,
 ) -> dict[str, Any]:
     """
     Apply an Excel formula to a specific cell in a worksheet.
@@ -187,6 +194,10 @@ def apply_formula(
         sheet_name: Name of the worksheet.
         cell: Cell reference (e.g., 'A1').
         formula: Excel formula to apply (with or without '=' prefix).
+        workbook: Already loaded workbook to modify in place. When given,
+            the workbook is not loaded from or saved to ``filename``.
+        pre_validated: Skip the cell reference and formula syntax checks
+            because the caller already ran validate_formula_in_cell_operation().
 
     Returns:
         Dict containing operation result details.
@@ -196,12 +207,14 @@ def apply_formula(
         FormulaError: If formula application or file save fails.
     """
     # Input validation
-    if not validate_cell_reference(cell):
+    if not pre_validated and not validate_cell_reference(cell):
         raise ValidationError(f"Invalid cell reference: {cell}")
 
     # Load workbook and validate sheet
     # Use data_only=False to preserve existing formulas when modifying the file
-    workbook = get_or_create_workbook(str(filename), data_only=False)
+    save = workbook is None
+    if workbook is None:
+        workbook = get_or_create_workbook(str(filename), data_only=False)
     if sheet_name not in workbook.sheetnames:
         raise ValidationError(f"Sheet '{sheet_name}' not found")
     worksheet = workbook[sheet_name]
@@ -210,9 +223,10 @@ def apply_formula(
     formula = formula if formula.startswith("=") else f"={formula}"
 
     # Validate formula syntax
-    is_valid, message = validate_formula(formula)
-    if not is_valid:
-        raise FormulaError(f"Invalid formula syntax: {message}")
+    if not pre_validated:
+        is_valid, message = validate_formula(formula)
+        if not is_valid:
+            raise FormulaError(f"Invalid formula syntax: {message}")
 
     # Apply formula to the specified cell in the worksheet
     try:
@@ -221,10 +235,11 @@ def apply_formula(
         raise FormulaError(f"Failed to apply formula to cell: {str(e)}") from e
 
     # Save the workbook to the specified file
-    try:
-        workbook.save(str(filename))
-    except Exception as e:
-        raise FormulaError(f"Failed to save workbook: {str(e)}") from e
+    if save:
+        try:
+            workbook.save(str(filename))
+        except Exception as e:
+            raise FormulaError(f"Failed to save workbook: {str(e)}") from e
 
     # Return success result
     result = {
@@ -234,3 +249,99 @@ def apply_formula(
         "formula": formula,
     }
     return result
+
+
+def apply_formulas_bulk(
+    filename: str | Path,
+    formulas: list[tuple[str, str, str]],
+    workbook: Workbook | None = None,
+) -> dict[str, Any]:
+    """
+    Apply several Excel formulas with a single workbook load and save.
+
+    Every entry is validated against the loaded workbook first. If any entry
+    fails validation, or writing one raises, nothing is applied: cells
+    already written are restored, so neither the file nor a caller-supplied
+    workbook is left with only part of the batch.
+
+    Args:
+        filename: Path to the Excel file.
+        formulas: (sheet_name, cell, formula) entries to apply, in order.
+        workbook: Already loaded workbook to modify in place. When given,
+            the workbook is not loaded from or saved to ``filename``.
+
+    Returns:
+        Dict containing the overall status and one result per entry.
+
+    Raises:
+        ValidationError: If no formulas are given.
+        FormulaError: If formula application or file save fails.
+    """
+    if not formulas:
+        raise ValidationError("No formulas provided")
+
+    # Use data_only=False to preserve existing formulas when modifying the file
+    save = workbook is None
+    if workbook is None:
+        workbook = get_or_create_workbook(str(filename), data_only=False)
+
+    # Validate every entry before touching any cell
+    entries: list[tuple[str, str, str]] = []
+    results: list[dict[str, Any]] = []
+    for sheet_name, cell, formula in formulas:
+        formula = formula if formula.startswith("=") else f"={formula}"
+        validation = validate_formula_in_cell_operation(
+            str(filename), sheet_name, cell, formula, workbook=workbook
+        )
+        entries.append((sheet_name, cell, formula))
+        results.append(
+            {
+                "status": validation["status"],
+                "message": validation["message"],
+                "sheet_name": sheet_name,
+                "cell": cell,
+                "formula": formula,
+            }
+        )
+
+    failed = sum(1 for result in results if result["status"] == "error")
+    if failed:
+        return {
+            "status": "error",
+            "message": (
+                f"{failed} of {len(results)} formulas failed validation; "
+                "no formulas were applied"
+            ),
+            "results": results,
+        }
+
+    # Apply formulas, looking each worksheet up only once. Previous values
+    # are kept so a failure partway leaves a caller's workbook unchanged.
+    worksheets: dict[str, Any] = {}
+    written: list[tuple[Any, Any]] = []
+    try:
+        for sheet_name, cell, formula in entries:
+            worksheet = worksheets.get(sheet_name)
+            if worksheet is None:
+                worksheet = worksheets[sheet_name] = workbook[sheet_name]
+            target = worksheet[cell]
+            previous = target.value
+            target.value = formula
+            written.append((target, previous))
+    except Exception as e:
+        for target, value in reversed(written):
+            target.value = value
+        raise FormulaError(f"Failed to apply formula to cell: {str(e)}") from e
+
+    if save:
+        try:
+            workbook.save(str(filename))
+        except Exception as e:
+            raise FormulaError(f"Failed to save workbook: {str(e)}") from e
+
+    return {
+        "status": "success",
+        "message": f"Applied {len(entries)} formulas",
+        "applied": len(entries),
+        "results": results,
+    }
@@ -69,20 +69,12 @@ def create_chart_in_sheet(
 ) -> dict[str, Any]:
     """Create chart in sheet with enhanced styling options"""
     try:
-        wb = load_workbook(filename)
-        if sheet_name not in wb.sheetnames:
-            return {"status": "error", "message": f"Sheet '{sheet_name}' not found"}
-        worksheet = cast(Worksheet, wb[sheet_name])
+        # Validate the request before loading the workbook. Chart data is
+        # referenced by coordinates only, so no cell values are read here.
         if "!" in data_range:
             range_sheet_name, cell_range = data_range.split("!")
-            if range_sheet_name not in wb.sheetnames:
-                return {
-                    "status": "error",
-                    "message": f"Sheet '{range_sheet_name}' referenced in data range not found",
-                }
-            worksheet = cast(Worksheet, wb[range_sheet_name])
         else:
-            cell_range = data_range
+            range_sheet_name, cell_range = None, data_range
         try:
             start_cell, end_cell = cell_range.split(":")
             start_row, start_col, end_row, end_col = parse_cell_range(
@@ -119,6 +111,17 @@ def create_chart_in_sheet(
                     f"Supported types: {', '.join(chart_classes.keys())}"
                 ),
             }
+        wb = load_workbook(filename)
+        if sheet_name not in wb.sheetnames:
+            return {"status": "error", "message": f"Sheet '{sheet_name}' not found"}
+        worksheet = cast(Worksheet, wb[sheet_name])
+        if range_sheet_name is not None:
+            if range_sheet_name not in wb.sheetnames:
+                return {
+                    "status": "error",
+                    "message": f"Sheet '{range_sheet_name}' referenced in data range not found",
+                }
+            worksheet = cast(Worksheet, wb[range_sheet_name])
         chart = chart_class()
         chart.title = title
         if hasattr(chart, "x_axis"):
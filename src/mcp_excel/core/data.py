@@ -73,7 +73,7 @@ def _parse_cell_reference(cell_ref: str) -> tuple[int, int]:
         InvalidCellReferenceError: If the cell reference is invalid.
     """
     try:
-        coords = parse_cell_range(f"{cell_ref}:{cell_ref}")
+        coords = parse_cell_range(cell_ref)
         if not coords or None in coords[:2]:
             raise InvalidCellReferenceError(f"Invalid cell reference: {cell_ref}")
         return coords[0], coords[1]  # row, column
@@ -94,20 +94,29 @@ def _get_used_range(
     Returns:
         Tuple of (end_row, end_col) coordinates.
     """
-    end_row = start_row
-    end_col = start_col
+    # One streaming pass; per-cell access re-parses the sheet in read-only mode
+    rows = list(
+        worksheet.iter_rows(
+            min_row=start_row,
+            max_row=worksheet.max_row,
+            min_col=start_col,
+            max_col=worksheet.max_column,
+            values_only=True,
+        )
+    )
 
     # Find last used row
-    while end_row <= worksheet.max_row and any(
-        worksheet.cell(row=end_row, column=c).value is not None
-        for c in range(start_col, worksheet.max_column + 1)
-    ):
+    end_row = start_row
+    for values in rows:
+        if all(v is None for v in values):
+            break
         end_row += 1
 
     # Find last used column
-    while end_col <= worksheet.max_column and any(
-        worksheet.cell(row=r, column=end_col).value is not None
-        for r in range(start_row, worksheet.max_row + 1)
+    end_col = start_col
+    width = worksheet.max_column - start_col + 1
+    while end_col - start_col < width and any(
+        values[end_col - start_col] is not None for values in rows
     ):
         end_col += 1
 
@@ -146,7 +155,7 @@ def read_excel_range(
 
     wb = None
     try:
-        wb = load_workbook(str(path), read_only=True, data_only=True)
+        wb = load_workbook(str(path), read_only=True, data_only=True, keep_links=False)
         ws = _get_worksheet(wb, sheet_name)
 
         # Handle range string (e.g., "A1:B2")
@@ -171,13 +180,20 @@ def read_excel_range(
 
         # Read the data
         data: SheetData = []
-        for row in range(start_row, min(end_row, ws.max_row) + 1):
-            row_data = [
-                ws.cell(row=row, column=col).value
-                for col in range(start_col, min(end_col, ws.max_column) + 1)
-            ]
-            if any(v is not None for v in row_data):
-                data.append(row_data)
+        max_row = min(end_row, ws.max_row)
+        max_col = min(end_col, ws.max_column)
+        # iter_rows treats a 0 bound as "no bound", so empty ranges stop here
+        if max_row < start_row or max_col < start_col:
+            return data
+        for values in ws.iter_rows(
+            min_row=start_row,
+            max_row=max_row,
+            min_col=start_col,
+            max_col=max_col,
+            values_only=True,
+        ):
+            if any(v is not None for v in values):
+                data.append(list(values))
 
         return data
 
@@ -197,7 +213,11 @@ def read_excel_range(
 
 
 def _write_data_to_worksheet(
-    worksheet: Worksheet, data: SheetData, start_row: int, start_col: int
+    worksheet: Worksheet,
+    data: SheetData,
+    start_row: int,
+    start_col: int,
+    new_sheet: bool = False,
 ) -> None:
     """Write data to a worksheet starting at the specified coordinates.
 
@@ -206,10 +226,26 @@ def _write_data_to_worksheet(
         data: 2D list of data to write.
         start_row: Starting row (1-based).
         start_col: Starting column (1-based).
+        new_sheet: True if the worksheet was just created and has no rows yet,
+            which allows appending whole rows instead of addressing each cell.
 
     Note:
         None values are skipped to preserve existing cell formatting.
     """
+    if new_sheet:
+        # append() writes after the last row, so skip down to start_row first
+        for _ in range(start_row - 1):
+            worksheet.append(())
+        for row_data in data:
+            worksheet.append(
+                {
+                    start_col + col_idx: value
+                    for col_idx, value in enumerate(row_data)
+                    if value is not None
+                }
+            )
+        return
+
     for row_idx, row_data in enumerate(data):
         for col_idx, value in enumerate(row_data):
             if value is not None:  # Skip None values to preserve cell formatting
@@ -267,10 +303,12 @@ def write_data(
             raise WorkbookError(f"Failed to access workbook: {str(e)}") from e
 
         # Get or create worksheet
+        new_sheet = False
         try:
             if not sheet_name:
                 if not wb.sheetnames:  # If no sheets exist
                     ws = wb.create_sheet("Sheet1")
+                    new_sheet = True
                 else:
                     ws = wb.active
             else:
@@ -278,6 +316,7 @@ def write_data(
                     ws = wb[sheet_name]
                 else:
                     ws = wb.create_sheet(sheet_name)
+                    new_sheet = True
         except Exception as e:
             raise SheetError(f"Failed to access worksheet: {str(e)}") from e
 
@@ -299,7 +338,7 @@ def write_data(
         path.parent.mkdir(parents=True, exist_ok=True)
 
         # Write data
-        _write_data_to_worksheet(ws, data, start_row, start_col)
+        _write_data_to_worksheet(ws, data, start_row, start_col, new_sheet)
 
         # Save changes
         try:
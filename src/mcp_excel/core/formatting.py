@@ -1,5 +1,7 @@
 from typing import Any, Literal, TypedDict
 
+from openpyxl import Workbook
+from openpyxl.cell.cell import Cell
 from openpyxl.formatting.rule import (
     CellIsRule,
     ColorScaleRule,
@@ -54,6 +56,29 @@ class FontArgs(TypedDict, total=False):
     color: Color
 
 
+def _apply_cell_style(
+    cell: Cell,
+    font: Font,
+    fill: PatternFill | None,
+    border: Border | None,
+    align: Alignment | None,
+    protect: Protection | None,
+    number_format: str | None,
+) -> None:
+    """Assign the prepared style objects to a single cell."""
+    cell.font = font
+    if fill:
+        cell.fill = fill
+    if border:
+        cell.border = border
+    if align:
+        cell.alignment = align
+    if protect:
+        cell.protection = protect
+    if number_format:
+        cell.number_format = number_format
+
+
 def format_range(
     filename: str,
     sheet_name: str,
@@ -73,6 +98,7 @@ def format_range(
     merge_cells: bool = False,
     protection: dict[str, Any] | None = None,
     conditional_format: dict[str, Any] | None = None,
+    workbook: Workbook | None = None,
 ) -> dict[str, Any]:
     # Cell validation
     if not validate_cell_reference(start_cell):
@@ -84,20 +110,16 @@ def format_range(
         return {"status": "error", "message": f"Invalid end cell reference: {end_cell}"}
     try:
         # Use data_only=False to preserve existing formulas when applying formatting
-        wb = get_or_create_workbook(filename, data_only=False)
+        # A caller-supplied workbook is modified in place and not saved
+        wb = (
+            workbook
+            if workbook is not None
+            else get_or_create_workbook(filename, data_only=False)
+        )
         if sheet_name not in wb.sheetnames:
             return {"status": "error", "message": f"Sheet '{sheet_name}' not found"}
         sheet = wb[sheet_name]
-        try:
-            start_row, start_col, end_row, end_col = parse_cell_range(
-                start_cell, end_cell
-            )
-        except ValueError as e:
-            return {"status": "error", "message": f"Invalid cell range: {str(e)}"}
-        if end_row is None:
-            end_row = start_row
-        if end_col is None:
-            end_col = start_col
+        single_cell = end_cell is None or end_cell == start_cell
         # Font configuration with proper typing
         font_args: FontArgs = {
             "bold": bold,
@@ -145,20 +167,35 @@ def format_range(
         protect = Protection(**protection) if protection else None
 
         # Aplicar formato
-        for row in range(start_row, end_row + 1):
-            for col in range(start_col, end_col + 1):
-                cell = sheet.cell(row=row, column=col)
-                cell.font = font
-                if fill:
-                    cell.fill = fill
-                if border:
-                    cell.border = border
-                if align:
-                    cell.alignment = align
-                if protect:
-                    cell.protection = protect
-                if number_format:
-                    cell.number_format = number_format
+        if single_cell:
+            # Single cell: skip range parsing and iteration
+            try:
+                cell = sheet[start_cell]
+            except ValueError as e:
+                return {"status": "error", "message": f"Invalid cell range: {str(e)}"}
+            _apply_cell_style(cell, font, fill, border, align, protect, number_format)
+        else:
+            try:
+                start_row, start_col, end_row, end_col = parse_cell_range(
+                    start_cell, end_cell
+                )
+            except ValueError as e:
+                return {"status": "error", "message": f"Invalid cell range: {str(e)}"}
+            if end_row is None:
+                end_row = start_row
+            if end_col is None:
+                end_col = start_col
+            for row in range(start_row, end_row + 1):
+                for col in range(start_col, end_col + 1):
+                    _apply_cell_style(
+                        sheet.cell(row=row, column=col),
+                        font,
+                        fill,
+                        border,
+                        align,
+                        protect,
+                        number_format,
+                    )
         # Merge
         if merge_cells and end_cell:
             try:
@@ -210,7 +247,8 @@ def format_range(
                     "status": "error",
                     "message": f"Failed to apply conditional formatting: {str(e)}",
                 }
-        wb.save(filename)
+        if workbook is None:
+            wb.save(filename)
         range_str = f"{start_cell}:{end_cell}" if end_cell else start_cell
         return {
             "status": "success",
@@ -120,14 +120,8 @@ def create_pivot_table(
         if pivot_sheet_name in wb.sheetnames:
             wb.remove(wb[pivot_sheet_name])
         pivot_ws = wb.create_sheet(pivot_sheet_name)
-        # Write headers
-        current_row = 1
-        current_col = 1
-        for field in cleaned_rows:
-            cell = pivot_ws.cell(row=current_row, column=current_col, value=field)
-            cell.font = Font(bold=True)
-            current_col += 1
-        # If columns, add column headers
+        # Build the header row
+        headers: list[str] = list(cleaned_rows)
         col_headers = []
         if cleaned_columns:
             unique_col_combinations = _get_combinations(
@@ -137,61 +131,50 @@ def create_pivot_table(
                 }
             )
             for combo in unique_col_combinations:
+                col_key = tuple(combo[c] for c in cleaned_columns)
                 for value_field in cleaned_values:
                     header = (
                         " | ".join([str(combo[c]) for c in cleaned_columns])
                         + f" | {value_field} ({agg_func})"
                     )
-                    col_headers.append((combo, value_field, header))
-                    cell = pivot_ws.cell(
-                        row=current_row, column=current_col, value=header
-                    )
-                    cell.font = Font(bold=True)
-                    current_col += 1
+                    col_headers.append((col_key, value_field))
+                    headers.append(header)
         else:
-            for value_field in cleaned_values:
-                cell = pivot_ws.cell(
-                    row=current_row,
-                    column=current_col,
-                    value=f"{value_field} ({agg_func})",
-                )
-                cell.font = Font(bold=True)
-                current_col += 1
+            headers.extend(
+                f"{value_field} ({agg_func})" for value_field in cleaned_values
+            )
+        # Append whole rows to the fresh sheet instead of addressing each cell
+        pivot_ws.append(headers)
+        header_font = Font(bold=True)
+        for cell in pivot_ws[1]:
+            cell.font = header_font
         # Get unique values for each row field
-        field_values = {}
-        for field in cleaned_rows:
-            all_values = []
-            for record in data:
-                value = str(record.get(field, ""))
-                all_values.append(value)
-            field_values[field] = sorted(set(all_values))
+        field_values = {
+            field: sorted({str(record.get(field, "")) for record in data})
+            for field in cleaned_rows
+        }
         row_combinations = _get_combinations(field_values)
         total_rows = len(row_combinations) + 1
-        total_cols = len(cleaned_rows) + (
-            len(col_headers) if col_headers else len(cleaned_values)
-        )
+        total_cols = len(headers)
+        # Bucket the records once by their row and column field values
+        groups = _group_records(data, cleaned_rows + cleaned_columns)
         # Write data rows
-        current_row = 2
         for combo in row_combinations:
-            col = 1
-            for field in cleaned_rows:
-                pivot_ws.cell(row=current_row, column=col, value=combo[field])
-                col += 1
-            filtered_data = _filter_data(data, combo, {})
+            row_key = tuple(combo[field] for field in cleaned_rows)
+            row_values: list[Any] = list(row_key)
             if cleaned_columns:
-                for col_combo, value_field, _ in col_headers:
-                    filtered = _filter_data(filtered_data, {}, col_combo)
-                    value_a: float = _aggregate_values(filtered, value_field, agg_func)
-                    pivot_ws.cell(row=current_row, column=col, value=value_a)
-                    col += 1
-            else:
-                for value_field in cleaned_values:
-                    value_b: float = _aggregate_values(
-                        filtered_data, value_field, agg_func
+                for col_key, value_field in col_headers:
+                    filtered = groups.get(row_key + col_key, [])
+                    row_values.append(
+                        _aggregate_values(filtered, value_field, agg_func)
                     )
-                    pivot_ws.cell(row=current_row, column=col, value=value_b)
-                    col += 1
-            current_row += 1
+            else:
+                filtered_data = groups.get(row_key, [])
+                row_values.extend(
+                    _aggregate_values(filtered_data, value_field, agg_func)
+                    for value_field in cleaned_values
+                )
+            pivot_ws.append(row_values)
         # Create a table for the pivot data
         try:
             pivot_range = f"A1:{get_column_letter(total_cols)}{total_rows}"
@@ -248,6 +231,21 @@ def _get_combinations(field_values: dict[str, list[str]]) -> list[dict[str, str]
     return result
 
 
+def _group_records(
+    data: list[dict[str, Any]], fields: list[str]
+) -> dict[tuple[Any, ...], list[dict[str, Any]]]:
+    """Group records by their values for the given fields in a single pass.
+
+    Looking up a combination of values in the result selects the same records,
+    in the same order, as filtering the whole data with _filter_data().
+    """
+    groups: dict[tuple[Any, ...], list[dict[str, Any]]] = {}
+    for record in data:
+        key = tuple(record.get(field) for field in fields)
+        groups.setdefault(key, []).append(record)
+    return groups
+
+
 def _filter_data(
     data: list[dict[str, Any]], row_filters: dict[str, str], col_filters: dict[str, str]
 ) -> list[dict[str, Any]]:
@@ -0,0 +1,236 @@
+"""Core functionality for in-memory workbook sessions.
+
+A session keeps a loaded workbook in memory so that several mutating
+operations can be applied to it before it is written back to disk with a
+single save, instead of one full load/save cycle per operation.
+
+Writes that bypass the session while it is open are not merged into it.
+Instead, a commit refuses to overwrite a file that changed on disk since
+the session loaded or last saved it.
+"""
+
+import logging
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Final
+
+from openpyxl import Workbook
+
+from mcp_excel.core.workbook import get_or_create_workbook
+from mcp_excel.exceptions.exception_core import SessionError, WorkbookError
+
+
+logger = logging.getLogger(__name__)
+
+
+# Sessions left untouched for longer than this (in seconds) are committed
+# and closed the next time the session registry is accessed.
+SESSION_IDLE_TIMEOUT: Final[float] = 600.0
+
+
+def _disk_mtime(path: Path) -> int | None:
+    """Modification time of a file in nanoseconds, or None if it is missing."""
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+class WorkbookSession:
+    """An open workbook held in memory until it is committed."""
+
+    def __init__(
+        self,
+        session_id: str,
+        filepath: Path,
+        workbook: Workbook,
+        disk_mtime: int | None,
+    ):
+        self.session_id = session_id
+        self.filepath = filepath
+        self.workbook = workbook
+        self.dirty = False
+        self.last_used = time.monotonic()
+        # Modification time of the file the in-memory copy was loaded from
+        # or last saved to
+        self.disk_mtime = disk_mtime
+
+
+_sessions: dict[str, WorkbookSession] = {}
+_sessions_lock = threading.Lock()
+
+
+def _save_session(session: WorkbookSession) -> None:
+    """Write a session's workbook back to its file if it has pending changes."""
+    if not session.dirty:
+        return
+    if _disk_mtime(session.filepath) != session.disk_mtime:
+        raise WorkbookError(
+            f"Workbook {session.filepath} changed on disk since the session "
+            "loaded it; close the session without committing to discard it"
+        )
+    try:
+        session.workbook.save(str(session.filepath))
+    except Exception as e:
+        raise WorkbookError(
+            f"Failed to save workbook {session.filepath}: {str(e)}"
+        ) from e
+    session.dirty = False
+    session.disk_mtime = _disk_mtime(session.filepath)
+
+
+def _expire_idle_sessions() -> None:
+    """Commit and drop sessions that have been idle past the timeout.
+
+    Must be called with the registry lock held. This runs on behalf of
+    unrelated callers, so a session that cannot be saved is logged and kept
+    with its pending changes instead of raising; it is retried after
+    another idle period, or reports the error when committed or closed.
+    """
+    now = time.monotonic()
+    for session_id, session in list(_sessions.items()):
+        if now - session.last_used <= SESSION_IDLE_TIMEOUT:
+            continue
+        try:
+            _save_session(session)
+        except WorkbookError as e:
+            logger.warning("Keeping idle session '%s' open: %s", session_id, e)
+            session.last_used = now
+            continue
+        session.workbook.close()
+        del _sessions[session_id]
+
+
+def open_session(filename: str | Path) -> dict[str, Any]:
+    """Load a workbook into memory and start a new session for it.
+
+    Args:
+        filename: Path to the Excel file. Created on commit if it doesn't exist.
+
+    Returns:
+        Dictionary with the new session id and the resolved file path.
+    """
+    path = Path(filename).resolve()
+    # Taken before the load, so a write racing it counts as a change
+    disk_mtime = _disk_mtime(path)
+    workbook = get_or_create_workbook(path, data_only=False)
+    session = WorkbookSession(uuid.uuid4().hex, path, workbook, disk_mtime)
+
+    with _sessions_lock:
+        _expire_idle_sessions()
+        _sessions[session.session_id] = session
+
+    return {
+        "status": "success",
+        "message": f"Opened session for {path}",
+        "session_id": session.session_id,
+        "filepath": str(path),
+    }
+
+
+def get_session_workbook(session_id: str, filename: str | Path) -> Workbook:
+    """Get the in-memory workbook of a session for a mutating operation.
+
+    Call mark_session_dirty() once the operation has succeeded, so that a
+    failed operation does not make the next commit rewrite the file.
+
+    Args:
+        session_id: Id returned by open_session().
+        filename: Path of the file the caller operates on. Must match the
+            file the session was opened for.
+
+    Returns:
+        Workbook: The session's openpyxl Workbook.
+
+    Raises:
+        SessionError: If the session doesn't exist or belongs to another file.
+    """
+    with _sessions_lock:
+        _expire_idle_sessions()
+        session = _sessions.get(session_id)
+        if session is None:
+            raise SessionError(f"Session '{session_id}' not found")
+        if Path(filename).resolve() != session.filepath:
+            raise SessionError(
+                f"Session '{session_id}' belongs to {session.filepath}, not {filename}"
+            )
+        session.last_used = time.monotonic()
+        return session.workbook
+
+
+def mark_session_dirty(session_id: str) -> None:
+    """Record that a session's workbook has changes to write on commit.
+
+    Args:
+        session_id: Id returned by open_session().
+
+    Raises:
+        SessionError: If the session doesn't exist.
+    """
+    with _sessions_lock:
+        session = _sessions.get(session_id)
+        if session is None:
+            raise SessionError(f"Session '{session_id}' not found")
+        session.dirty = True
+
+
+def commit_session(session_id: str) -> dict[str, Any]:
+    """Write a session's pending changes to disk, keeping the session open.
+
+    Args:
+        session_id: Id returned by open_session().
+
+    Returns:
+        Dictionary with operation status and the committed file path.
+
+    Raises:
+        SessionError: If the session doesn't exist.
+        WorkbookError: If the workbook cannot be saved.
+    """
+    with _sessions_lock:
+        session = _sessions.get(session_id)
+        if session is None:
+            raise SessionError(f"Session '{session_id}' not found")
+        _save_session(session)
+        session.last_used = time.monotonic()
+
+    return {
+        "status": "success",
+        "message": f"Committed session to {session.filepath}",
+        "session_id": session_id,
+        "filepath": str(session.filepath),
+    }
+
+
+def close_session(session_id: str, commit: bool = True) -> dict[str, Any]:
+    """Close a session, committing its pending changes first by default.
+
+    Args:
+        session_id: Id returned by open_session().
+        commit: If False, pending changes are discarded.
+
+    Returns:
+        Dictionary with operation status and the session's file path.
+
+    Raises:
+        SessionError: If the session doesn't exist.
+        WorkbookError: If the workbook cannot be saved.
+    """
+    with _sessions_lock:
+        session = _sessions.get(session_id)
+        if session is None:
+            raise SessionError(f"Session '{session_id}' not found")
+        # Save before dropping the session so a failed save can be retried
+        if commit:
+            _save_session(session)
+        del _sessions[session_id]
+        session.workbook.close()
+
+    return {
+        "status": "success",
+        "message": f"Closed session for {session.filepath}",
+        "session_id": session_id,
+        "filepath": str(session.filepath),
+    }
@@ -4,14 +4,17 @@ This module provides functions to create, modify, and inspect Excel workbooks
 following the Model Context Protocol (MCP) standards.
 """
 
+import zipfile
 from collections.abc import Generator
 from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 from openpyxl import Workbook, load_workbook
 from openpyxl.utils import get_column_letter
 from openpyxl.worksheet.worksheet import Worksheet
+from openpyxl.xml.functions import fromstring
 
 from mcp_excel.exceptions.exception_core import (
     SheetExistsError,
@@ -22,6 +25,18 @@ from mcp_excel.exceptions.exception_core import (
 )
 
 
+# Sheet entries of the workbook part, in transitional and strict OOXML
+_SHEET_TAGS = (
+    "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}sheet",
+    "{http://purl.oclc.org/ooxml/spreadsheetml/main}sheet",
+)
+_PACKAGE_REL_TAG = (
+    "{http://schemas.openxmlformats.org/package/2006/relationships}Relationship"
+)
+# Default workbook part, used when the package has no officeDocument relationship
+_DEFAULT_WORKBOOK_PART = "xl/workbook.xml"
+
+
 def create_workbook(
     filename: str | Path, sheet_name: str = "Sheet1", data_only: bool = False
 ) -> dict[str, Any]:
@@ -224,27 +239,36 @@ def get_workbook_info(
 
     wb = None
     try:
-        # Load in read-only mode for better performance with large files
-        wb = load_workbook(str(path), read_only=True, data_only=True)
+        stat = path.stat()
 
         # Basic file information
         info: dict[str, Any] = {
             "filename": path.name,
-            "sheets": wb.sheetnames,
-            "size": path.stat().st_size,
-            "modified": path.stat().st_mtime,
+            "sheets": None,
+            "size": stat.st_size,
+            "modified": stat.st_mtime,
             "used_ranges": None,
         }
 
-        # Calculate used ranges if requested
-        if include_ranges:
-            ranges: dict[str, str] = {}
-            for sheet_name in wb.sheetnames:
-                ws = wb[sheet_name]
-                if range_str := _get_worksheet_range(ws):
-                    ranges[sheet_name] = range_str
+        # Sheet names only need the workbook part, not the worksheets
+        if not include_ranges:
+            info["sheets"] = list(
+                _read_sheet_names(str(path), stat.st_mtime_ns, stat.st_size)
+            )
+            return info
 
-            info["used_ranges"] = ranges or None
+        # Load in read-only mode for better performance with large files
+        wb = load_workbook(str(path), read_only=True, data_only=True)
+        info["sheets"] = wb.sheetnames
+
+        # Calculate used ranges
+        ranges: dict[str, str] = {}
+        for sheet_name in wb.sheetnames:
+            ws = wb[sheet_name]
+            if range_str := _get_worksheet_range(ws):
+                ranges[sheet_name] = range_str
+
+        info["used_ranges"] = ranges or None
 
         return info
 
@@ -257,6 +281,58 @@ def get_workbook_info(
             wb.close()
 
 
+@lru_cache(maxsize=128)
+def _read_sheet_names(filepath: str, mtime_ns: int, size: int) -> tuple[str, ...]:
+    """Read the sheet names of a workbook straight from its workbook part.
+
+    Avoids building the openpyxl object model when only the sheet list is
+    needed. The part is found through _rels/.rels, and both transitional and
+    strict OOXML are understood; if no sheets are found this way the file is
+    opened with openpyxl instead. Results are cached per file, modification
+    time and size, so a file rewritten on disk is read again.
+
+    Args:
+        filepath: Absolute path to the .xlsx file.
+        mtime_ns: Modification time of the file, used as part of the cache key.
+        size: Size of the file in bytes, used as part of the cache key.
+
+    Returns:
+        Tuple of sheet names in workbook order.
+    """
+    names: tuple[str, ...] = ()
+    with zipfile.ZipFile(filepath) as archive:
+        part = _workbook_part(archive)
+        if part is not None:
+            root = fromstring(archive.read(part))
+            names = tuple(
+                sheet.attrib["name"]
+                for tag in _SHEET_TAGS
+                for sheet in root.iter(tag)
+                if "name" in sheet.attrib
+            )
+    if names:
+        return names
+
+    wb = load_workbook(filepath, read_only=True)
+    try:
+        return tuple(wb.sheetnames)
+    finally:
+        wb.close()
+
+
+def _workbook_part(archive: zipfile.ZipFile) -> str | None:
+    """Name of the workbook part in a package, or None if there is none."""
+    names = set(archive.namelist())
+    if "_rels/.rels" in names:
+        rels = fromstring(archive.read("_rels/.rels"))
+        for rel in rels.iter(_PACKAGE_REL_TAG):
+            if rel.attrib.get("Type", "").endswith("/officeDocument"):
+                part: str = rel.attrib.get("Target", "").lstrip("/")
+                if part in names:
+                    return part
+    return _DEFAULT_WORKBOOK_PART if _DEFAULT_WORKBOOK_PART in names else None
+
+
 def _validate_sheet_name(sheet_name: str) -> None:
     """Validate that the sheet name is valid according to Excel's rules.
 
@@ -325,7 +401,13 @@ def _load_existing_workbook(
         Workbook: An openpyxl Workbook object.
     """
     try:
-        return load_workbook(str(filepath), read_only=read_only, data_only=data_only)
+        # External links only matter when saving, which read-only books cannot do
+        return load_workbook(
+            str(filepath),
+            read_only=read_only,
+            data_only=data_only,
+            keep_links=not read_only,
+        )
     except PermissionError as e:
         raise PermissionError(f"Cannot access {filepath}: {e}") from e
     except Exception as e:
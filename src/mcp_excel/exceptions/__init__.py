@@ -14,6 +14,7 @@ from mcp_excel.exceptions.exception_core import (
     InvalidDataError,
     PivotError,
     RangeError,
+    SessionError,
     SheetError,
     SheetExistsError,
     SheetNotFoundError,
@@ -51,6 +52,7 @@ __all__ = [
     "RangeError",
     "FormulaError",
     "PivotError",
+    "SessionError",
     "ValidationError",
     # Tools exceptions
     "ExcelMCPError",
@@ -122,6 +122,15 @@ class PivotError(CoreError):
     pass
 
 
+# * --- Session Exceptions ---
+class SessionError(CoreError):
+    """Raised when a workbook session is missing or misused.
+    Used in core/session.py
+    """
+
+    pass
+
+
 # * --- Validation Exceptions ---
 class ValidationError(CoreError):
     """Raised when validation fails.
@@ -0,0 +1,56 @@
+"""Shared error handling for tool functions."""
+
+import functools
+import inspect
+from collections.abc import Callable
+from typing import Any, TypeVar, cast
+
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+def _error(message: str) -> dict[str, str]:
+    return {"status": "error", "message": message}
+
+
+def tool_error_wrapper(
+    failure_message: str, expected: tuple[type[Exception], ...]
+) -> Callable[[F], F]:
+    """
+    Decorator that turns exceptions raised by a tool into an error payload.
+
+    Args:
+        failure_message: Prefix for unexpected errors (e.g., "Failed to apply formula").
+        expected: Exception types reported as "Error: <message>".
+
+    Returns:
+        A decorator function that can be applied to sync or async functions.
+        Both return {"status": "error", "message": ...} on failure.
+    """
+
+    def decorator(func: F) -> F:
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                try:
+                    return await func(*args, **kwargs)
+                except expected as e:
+                    return _error("Error: " + str(e))
+                except Exception as e:
+                    return _error(failure_message + ": " + str(e))
+
+            return cast(F, async_wrapper)
+
+        @functools.wraps(func)
+        def sync_wrapper(*args: Any, **kwargs: Any) -> Any:
+            try:
+                return func(*args, **kwargs)
+            except expected as e:
+                return _error("Error: " + str(e))
+            except Exception as e:
+                return _error(failure_message + ": " + str(e))
+
+        return cast(F, sync_wrapper)
+
+    return decorator
@@ -2,7 +2,7 @@ from typing import Any
 
 from mcp_excel.core.data import read_excel_range
 from mcp_excel.exceptions.exception_tools import DataError, ValidationError
-from mcp_excel.utils.file_utils import ensure_xlsx_extension, validate_file_access
+from mcp_excel.utils.file_utils import validate_file_access
 
 
 @validate_file_access("filename")
@@ -47,9 +47,6 @@ async def read_data_from_excel(
         • If the target range is empty, status will be "error" with a descriptive message.
     """
     try:
-        # Ensure filename has .xlsx extension
-        filename = ensure_xlsx_extension(filename)
-
         # Read data from Excel
         data = read_excel_range(
             filename=filename,
@@ -123,7 +120,6 @@ async def write_data_to_excel(
         • The function does not create new worksheets; the target sheet must already exist.
         • Input data is written as-is, without formula injection or type conversion.
     """
-    filename = ensure_xlsx_extension(filename)
     try:
         from mcp_excel.core.data import write_data
 
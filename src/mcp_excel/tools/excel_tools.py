@@ -4,7 +4,6 @@ from typing import Any
 from mcp_excel.core.workbook import create_sheet, create_workbook
 from mcp_excel.exceptions.exception_tools import ValidationError, WorkbookError
 from mcp_excel.utils.file_utils import (
-    ensure_xlsx_extension,
     list_excel_files_in_directory,
     resolve_safe_path,
     validate_file_access,
@@ -63,8 +62,6 @@ async def create_excel_worksheet(filename: str, sheet_name: str) -> dict[str, An
             Example: {"status": "success", "sheet": "NewData"}
         On error, returns a dictionary with status "error" and a descriptive message.
     """
-    filename = ensure_xlsx_extension(filename)
-
     try:
         result: dict[str, Any] = create_sheet(filename, sheet_name)
         return result
@@ -1,6 +1,7 @@
 from typing import Any
 
 from mcp_excel.core.formatting import BorderStyle, format_range
+from mcp_excel.core.session import get_session_workbook, mark_session_dirty
 from mcp_excel.core.workbook import get_workbook_info
 
 # Import exceptions
@@ -10,6 +11,7 @@ from mcp_excel.exceptions.exception_tools import (
     ValidationError,
     WorkbookError,
 )
+from mcp_excel.utils.cell_utils import RANGE_REFERENCE_RE
 from mcp_excel.utils.file_utils import ensure_xlsx_extension
 from mcp_excel.utils.sheet_utils import (
     copy_range_operation,
@@ -41,6 +43,7 @@ async def format_range_excel(
     merge_cells: bool = False,
     protection: dict[str, Any] | None = None,
     conditional_format: dict[str, Any] | None = None,
+    session_id: str | None = None,
 ) -> dict[str, Any]:
     """Apply a wide range of visual and data formatting styles to a specified cell range in an Excel worksheet.
 
@@ -72,6 +75,7 @@ async def format_range_excel(
         merge_cells (bool, optional): Merge the entire specified range into a single cell. Defaults to False.
         protection (dict[str, Any] | None, optional): Cell protection settings (e.g., `{"locked": True}`). Defaults to None.
         conditional_format (dict[str, Any] | None, optional): Rules for conditional formatting. Defaults to None.
+        session_id (str | None, optional): Id of an open workbook session. If given, the change is applied to the session's in-memory workbook and written to disk on commit. Defaults to None.
 
     Returns:
         dict[str, Any]: A dictionary indicating the status ("success" or "error") and a descriptive message.
@@ -79,6 +83,7 @@ async def format_range_excel(
 
     filename = ensure_xlsx_extension(filename)
     try:
+        workbook = get_session_workbook(session_id, filename) if session_id else None
         result: dict[str, Any] = format_range(
             filename=filename,
             sheet_name=sheet_name,
@@ -98,12 +103,15 @@ async def format_range_excel(
             merge_cells=merge_cells,
             protection=protection,
             conditional_format=conditional_format,
+            workbook=workbook,
         )
+        if session_id:
+            mark_session_dirty(session_id)
         return result
     except (ValidationError, FormattingError) as e:
-        return {"status": "error", "message": f"Error: {str(e)}"}
+        return {"status": "error", "message": "Error: " + str(e)}
     except Exception as e:
-        return {"status": "error", "message": f"Failed to format range: {str(e)}"}
+        return {"status": "error", "message": "Failed to format range: " + str(e)}
 
 
 async def copy_worksheet(
@@ -128,9 +136,9 @@ async def copy_worksheet(
         result: dict[str, Any] = copy_sheet(filename, source_sheet, target_sheet)
         return result
     except (ValidationError, SheetError) as e:
-        return {"status": "error", "message": f"Error: {str(e)}"}
+        return {"status": "error", "message": "Error: " + str(e)}
     except Exception as e:
-        return {"status": "error", "message": f"Failed to copy worksheet: {str(e)}"}
+        return {"status": "error", "message": "Failed to copy worksheet: " + str(e)}
 
 
 async def delete_worksheet(filename: str, sheet_name: str) -> dict[str, Any]:
@@ -152,9 +160,9 @@ async def delete_worksheet(filename: str, sheet_name: str) -> dict[str, Any]:
         result: dict[str, Any] = delete_sheet(filename, sheet_name)
         return result
     except (ValidationError, SheetError) as e:
-        return {"status": "error", "message": f"Error: {str(e)}"}
+        return {"status": "error", "message": "Error: " + str(e)}
     except Exception as e:
-        return {"status": "error", "message": f"Failed to delete worksheet: {str(e)}"}
+        return {"status": "error", "message": "Failed to delete worksheet: " + str(e)}
 
 
 async def rename_worksheet(
@@ -179,9 +187,9 @@ async def rename_worksheet(
         result: dict[str, Any] = rename_sheet(filename, old_name, new_name)
         return result
     except (ValidationError, SheetError) as e:
-        return {"status": "error", "message": f"Error: {str(e)}"}
+        return {"status": "error", "message": "Error: " + str(e)}
     except Exception as e:
-        return {"status": "error", "message": f"Failed to rename worksheet: {str(e)}"}
+        return {"status": "error", "message": "Failed to rename worksheet: " + str(e)}
 
 
 async def get_workbook_metadata(
@@ -207,16 +215,20 @@ async def get_workbook_metadata(
         )
         return result
     except WorkbookError as e:
-        return {"status": "error", "message": f"Error: {str(e)}"}
+        return {"status": "error", "message": "Error: " + str(e)}
     except Exception as e:
         return {
             "status": "error",
-            "message": f"Failed to get workbook metadata: {str(e)}",
+            "message": "Failed to get workbook metadata: " + str(e),
         }
 
 
 async def merge_cells(
-    filename: str, sheet_name: str, start_cell: str, end_cell: str
+    filename: str,
+    sheet_name: str,
+    start_cell: str,
+    end_cell: str,
+    session_id: str | None = None,
 ) -> dict[str, Any]:
     """Merge a rectangular range of cells into a single, larger cell.
 
@@ -228,6 +240,7 @@ async def merge_cells(
         sheet_name (str): The name of the worksheet where the merge will occur.
         start_cell (str): The top-left cell of the range to merge.
         end_cell (str): The bottom-right cell of the range to merge.
+        session_id (str | None, optional): Id of an open workbook session. If given, the change is applied to the session's in-memory workbook and written to disk on commit. Defaults to None.
 
     Returns:
         dict[str, Any]: A status dictionary indicating success or failure.
@@ -235,16 +248,25 @@ async def merge_cells(
     filename = ensure_xlsx_extension(filename)
 
     try:
-        result: dict[str, Any] = merge_range(filename, sheet_name, start_cell, end_cell)
+        workbook = get_session_workbook(session_id, filename) if session_id else None
+        result: dict[str, Any] = merge_range(
+            filename, sheet_name, start_cell, end_cell, workbook=workbook
+        )
+        if session_id:
+            mark_session_dirty(session_id)
         return result
     except (ValidationError, SheetError) as e:
-        return {"status": "error", "message": f"Error: {str(e)}"}
+        return {"status": "error", "message": "Error: " + str(e)}
     except Exception as e:
-        return {"status": "error", "message": f"Failed to merge cells: {str(e)}"}
+        return {"status": "error", "message": "Failed to merge cells: " + str(e)}
 
 
 async def unmerge_cells(
-    filename: str, sheet_name: str, start_cell: str, end_cell: str
+    filename: str,
+    sheet_name: str,
+    start_cell: str,
+    end_cell: str,
+    session_id: str | None = None,
 ) -> dict[str, Any]:
     """Unmerge a previously merged cell range, reverting it to individual cells.
 
@@ -256,6 +278,7 @@ async def unmerge_cells(
         sheet_name (str): The name of the worksheet containing the merged cells.
         start_cell (str): The top-left cell of the range to unmerge.
         end_cell (str): The bottom-right cell of the range to unmerge.
+        session_id (str | None, optional): Id of an open workbook session. If given, the change is applied to the session's in-memory workbook and written to disk on commit. Defaults to None.
 
     Returns:
         dict[str, Any]: A status dictionary indicating success or failure.
@@ -263,14 +286,17 @@ async def unmerge_cells(
     filename = ensure_xlsx_extension(filename)
 
     try:
+        workbook = get_session_workbook(session_id, filename) if session_id else None
         result: dict[str, Any] = unmerge_range(
-            filename, sheet_name, start_cell, end_cell
+            filename, sheet_name, start_cell, end_cell, workbook=workbook
         )
+        if session_id:
+            mark_session_dirty(session_id)
         return result
     except (ValidationError, SheetError) as e:
-        return {"status": "error", "message": f"Error: {str(e)}"}
+        return {"status": "error", "message": "Error: " + str(e)}
     except Exception as e:
-        return {"status": "error", "message": f"Failed to unmerge cells: {str(e)}"}
+        return {"status": "error", "message": "Failed to unmerge cells: " + str(e)}
 
 
 async def copy_range(
@@ -280,6 +306,7 @@ async def copy_range(
     source_end: str,
     target_start: str,
     target_sheet: str | None = None,
+    session_id: str | None = None,
 ) -> dict[str, Any]:
     """Copy a range of cells, including their values and formatting, to a new location, potentially in a different worksheet.
 
@@ -293,6 +320,7 @@ async def copy_range(
         source_end (str): The bottom-right cell of the source range.
         target_start (str): The top-left cell of the destination.
         target_sheet (str | None, optional): The name of the destination worksheet. If None, the same sheet is used. Defaults to None.
+        session_id (str | None, optional): Id of an open workbook session. If given, the change is applied to the session's in-memory workbook and written to disk on commit. Defaults to None.
 
     Returns:
         dict[str, Any]: A status dictionary indicating success or failure.
@@ -300,14 +328,23 @@ async def copy_range(
     filename = ensure_xlsx_extension(filename)
 
     try:
+        workbook = get_session_workbook(session_id, filename) if session_id else None
         result: dict[str, Any] = copy_range_operation(
-            filename, sheet_name, source_start, source_end, target_start, target_sheet
+            filename,
+            sheet_name,
+            source_start,
+            source_end,
+            target_start,
+            target_sheet,
+            workbook=workbook,
         )
+        if session_id:
+            mark_session_dirty(session_id)
         return result
     except (ValidationError, SheetError) as e:
-        return {"status": "error", "message": f"Error: {str(e)}"}
+        return {"status": "error", "message": "Error: " + str(e)}
     except Exception as e:
-        return {"status": "error", "message": f"Failed to copy range: {str(e)}"}
+        return {"status": "error", "message": "Failed to copy range: " + str(e)}
 
 
 async def delete_range(
@@ -316,6 +353,7 @@ async def delete_range(
     start_cell: str,
     end_cell: str,
     shift_direction: str = "up",
+    session_id: str | None = None,
 ) -> dict[str, Any]:
     """Delete a range of cells and optionally shift the surrounding cells to fill the gap.
 
@@ -328,6 +366,7 @@ async def delete_range(
         start_cell (str): The top-left cell of the range to delete.
         end_cell (str): The bottom-right cell of the range to delete.
         shift_direction (str, optional): Direction to shift cells after deletion ('up' or 'left'). Defaults to "up".
+        session_id (str | None, optional): Id of an open workbook session. If given, the change is applied to the session's in-memory workbook and written to disk on commit. Defaults to None.
 
     Returns:
         dict[str, Any]: A status dictionary indicating success or failure.
@@ -335,14 +374,22 @@ async def delete_range(
     filename = ensure_xlsx_extension(filename)
 
     try:
+        workbook = get_session_workbook(session_id, filename) if session_id else None
         result: dict[str, Any] = delete_range_operation(
-            filename, sheet_name, start_cell, end_cell, shift_direction
+            filename,
+            sheet_name,
+            start_cell,
+            end_cell,
+            shift_direction,
+            workbook=workbook,
         )
+        if session_id:
+            mark_session_dirty(session_id)
         return result
     except (ValidationError, SheetError) as e:
-        return {"status": "error", "message": f"Error: {str(e)}"}
+        return {"status": "error", "message": "Error: " + str(e)}
     except Exception as e:
-        return {"status": "error", "message": f"Failed to delete range: {str(e)}"}
+        return {"status": "error", "message": "Failed to delete range: " + str(e)}
 
 
 async def validate_excel_range(
@@ -364,15 +411,20 @@ async def validate_excel_range(
     """
     filename = ensure_xlsx_extension(filename)
 
+    range_str = start_cell if not end_cell else f"{start_cell}:{end_cell}"
+    if not RANGE_REFERENCE_RE.fullmatch(range_str):
+        return {"status": "error", "message": "Invalid range syntax: " + range_str}
+
     try:
-        range_str = start_cell if not end_cell else f"{start_cell}:{end_cell}"
         from mcp_excel.utils.validation_utils import (
             validate_range_in_sheet_operation as validate_range_impl,
         )
 
-        result: dict[str, Any] = validate_range_impl(filename, sheet_name, range_str)
+        result: dict[str, Any] = validate_range_impl(
+            filename, sheet_name, start_cell, end_cell
+        )
         return result
     except ValidationError as e:
-        return {"status": "error", "message": f"Error: {str(e)}"}
+        return {"status": "error", "message": "Error: " + str(e)}
     except Exception as e:
-        return {"status": "error", "message": f"Failed to validate range: {str(e)}"}
+        return {"status": "error", "message": "Failed to validate range: " + str(e)}
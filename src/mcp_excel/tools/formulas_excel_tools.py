@@ -1,14 +1,23 @@
 # Import exceptions
 from typing import Any
 
-from mcp_excel.core.calculations import apply_formula
+from openpyxl import Workbook, load_workbook
+
+from mcp_excel.core.calculations import apply_formula, apply_formulas_bulk
+from mcp_excel.core.session import get_session_workbook, mark_session_dirty
 from mcp_excel.exceptions.exception_tools import CalculationError, ValidationError
+from mcp_excel.tools._errors import tool_error_wrapper
+from mcp_excel.utils.cell_utils import CELL_REFERENCE_RE
 from mcp_excel.utils.file_utils import ensure_xlsx_extension, validate_file_access
 
 # Import core/tools/utils with new structure
-from mcp_excel.utils.validation_utils import validate_formula_in_cell_operation
+from mcp_excel.utils.validation_utils import (
+    validate_formula,
+    validate_formula_in_cell_operation,
+)
 
 
+@tool_error_wrapper("Failed to validate formula", (ValidationError, CalculationError))
 async def validate_formula_syntax(
     filename: str,
     sheet_name: str,
@@ -30,23 +39,27 @@ async def validate_formula_syntax(
         dict[str, Any]: A dictionary with validation status ("success" or "error") and a message.
     """
     filename = ensure_xlsx_extension(filename)
-    try:
-        result: dict[str, Any] = validate_formula_in_cell_operation(
-            filename, sheet_name, cell, formula
-        )
-        return result
-    except (ValidationError, CalculationError) as e:
-        return {"status": "error", "message": f"Error: {str(e)}"}
-    except Exception as e:
-        return {"status": "error", "message": f"Failed to validate formula: {str(e)}"}
+    if not CELL_REFERENCE_RE.fullmatch(cell):
+        return {"status": "error", "message": f"Invalid cell reference: {cell}"}
+    # Reject malformed formulas before paying for a workbook load
+    is_valid, message = validate_formula(formula)
+    if not is_valid:
+        return {"status": "error", "message": f"Invalid formula syntax: {message}"}
+    # Only the sheet names are read, through a read-only load
+    result: dict[str, Any] = validate_formula_in_cell_operation(
+        filename, sheet_name, cell, formula
+    )
+    return result
 
 
 @validate_file_access("filename")
+@tool_error_wrapper("Failed to apply formula", (ValidationError, CalculationError))
 async def apply_formula_excel(
     filename: str,
     sheet_name: str,
     cell: str,
     formula: str,
+    session_id: str | None = None,
 ) -> dict[str, Any]:
     """
     Apply a validated Excel formula to a specific cell in a worksheet.
@@ -64,6 +77,7 @@ async def apply_formula_excel(
         sheet_name (str): The name of the worksheet where the formula will be applied.
         cell (str): The cell reference to write the formula to (e.g., "A1").
         formula (str): The Excel formula to apply (e.g., "=SUM(A1:A10)").
+        session_id (str | None, optional): Id of an open workbook session. If given, the change is applied to the session's in-memory workbook and written to disk on commit. Defaults to None.
 
     Returns:
         dict[str, Any]: A status dictionary indicating success or failure, with a descriptive message.
@@ -72,19 +86,82 @@ async def apply_formula_excel(
         • The tool automatically validates the formula's syntax before attempting to apply it.
         • The cell's existing value or formula will be overwritten.
     """
-    filename = ensure_xlsx_extension(filename)
+    if session_id:
+        workbook = get_session_workbook(session_id, filename)
+        result = _validate_and_apply(filename, sheet_name, cell, formula, workbook)
+        if result["status"] != "error":
+            mark_session_dirty(session_id)
+        return result
 
+    # Validate and apply against a single load of the file
+    workbook = load_workbook(filename)
     try:
-        # First validate the formula
-        validation: dict[str, Any] = validate_formula_in_cell_operation(
-            filename, sheet_name, cell, formula
-        )
-        if isinstance(validation, dict) and validation.get("status") == "error":
-            return validation
+        result = _validate_and_apply(filename, sheet_name, cell, formula, workbook)
+        if result["status"] != "error":
+            workbook.save(filename)
+        return result
+    finally:
+        workbook.close()
 
-        result: dict[str, Any] = apply_formula(filename, sheet_name, cell, formula)
+
+def _validate_and_apply(
+    filename: str, sheet_name: str, cell: str, formula: str, workbook: Workbook
+) -> dict[str, Any]:
+    """Validate a formula against a loaded workbook, then write it."""
+    validation: dict[str, Any] = validate_formula_in_cell_operation(
+        filename, sheet_name, cell, formula, workbook=workbook
+    )
+    if validation["status"] == "error":
+        return validation
+
+    # Already validated above, so the core skips its own checks
+    result: dict[str, Any] = apply_formula(
+        filename, sheet_name, cell, formula, workbook=workbook, pre_validated=True
+    )
+    return result
+
+
+@validate_file_access("filename")
+@tool_error_wrapper("Failed to apply formulas", (ValidationError, CalculationError))
+async def apply_formulas_batch(
+    filename: str,
+    formulas: list[dict[str, str]],
+    session_id: str | None = None,
+) -> dict[str, Any]:
+    """
+    Apply several Excel formulas to a workbook in a single load and save.
+
+    Context for AI/LLM:
+        Use this tool instead of calling `apply_formula_excel` repeatedly when you need to write more than one formula, such as filling a calculated column or building a summary block. The workbook is opened and saved only once for the whole batch.
+
+    Args:
+        filename (str): Path to the Excel workbook.
+        formulas (list[dict[str, str]]): Formulas to apply, in order. Each entry needs the keys "sheet_name", "cell" and "formula" (e.g., `{"sheet_name": "Sheet1", "cell": "A11", "formula": "=SUM(A1:A10)"}`).
+        session_id (str | None, optional): Id of an open workbook session. If given, the change is applied to the session's in-memory workbook and written to disk on commit. Defaults to None.
+
+    Returns:
+        dict[str, Any]: A status dictionary with the number of applied formulas and one result per entry.
+
+    Notes:
+        • Every formula is validated before any is written. If one fails, none are applied and the per-entry results show which ones failed.
+    """
+    try:
+        entries = [
+            (entry["sheet_name"], entry["cell"], entry["formula"]) for entry in formulas
+        ]
+    except (KeyError, TypeError) as e:
+        return {
+            "status": "error",
+            "message": f"Each formula entry needs sheet_name, cell and formula: {e}",
+        }
+
+    if session_id:
+        workbook = get_session_workbook(session_id, filename)
+        result: dict[str, Any] = apply_formulas_bulk(
+            filename, entries, workbook=workbook
+        )
+        if result["status"] != "error":
+            mark_session_dirty(session_id)
         return result
-    except (ValidationError, CalculationError) as e:
-        return {"status": "error", "message": f"Error: {str(e)}"}
-    except Exception as e:
-        return {"status": "error", "message": f"Failed to apply formula: {str(e)}"}
+    result = apply_formulas_bulk(filename, entries)
+    return result
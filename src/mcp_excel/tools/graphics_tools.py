@@ -5,10 +5,12 @@ from mcp_excel.core.pivot import create_pivot_table as create_pivot_table_impl
 
 # Import exceptions
 from mcp_excel.exceptions.exception_tools import ChartError, PivotError, ValidationError
-from mcp_excel.utils.file_utils import ensure_xlsx_extension, validate_file_access
+from mcp_excel.tools._errors import tool_error_wrapper
+from mcp_excel.utils.file_utils import validate_file_access
 
 
 @validate_file_access("filename")
+@tool_error_wrapper("Failed to create chart", (ValidationError, ChartError))
 async def create_chart(
     filename: str,
     sheet_name: str,
@@ -37,27 +39,21 @@ async def create_chart(
     Returns:
         dict[str, Any]: A status dictionary indicating success or failure, with a descriptive message.
     """
-    filename = ensure_xlsx_extension(filename)
-
-    try:
-        result: dict[str, Any] = create_chart_impl(
-            filename=filename,
-            sheet_name=sheet_name,
-            data_range=data_range,
-            chart_type=chart_type,
-            target_cell=target_cell,
-            title=title,
-            x_axis=x_axis,
-            y_axis=y_axis,
-        )
-        return result
-    except (ValidationError, ChartError) as e:
-        return {"error": f"Error: {str(e)}"}
-    except Exception as e:
-        return {"error": f"Failed to create chart: {str(e)}"}
+    result: dict[str, Any] = create_chart_impl(
+        filename=filename,
+        sheet_name=sheet_name,
+        data_range=data_range,
+        chart_type=chart_type,
+        target_cell=target_cell,
+        title=title,
+        x_axis=x_axis,
+        y_axis=y_axis,
+    )
+    return result
 
 
 @validate_file_access("filename")
+@tool_error_wrapper("Failed to create pivot table", (ValidationError, PivotError))
 async def create_pivot_table(
     filename: str,
     sheet_name: str,
@@ -84,20 +80,13 @@ async def create_pivot_table(
     Returns:
         dict[str, Any]: A status dictionary indicating success or failure, with a descriptive message.
     """
-    filename = ensure_xlsx_extension(filename)
-
-    try:
-        result: dict[str, Any] = create_pivot_table_impl(
-            filename=filename,
-            sheet_name=sheet_name,
-            data_range=data_range,
-            rows=rows,
-            values=values,
-            columns=columns or [],
-            agg_func=agg_func,
-        )
-        return result
-    except (ValidationError, PivotError) as e:
-        return {"error": f"Error: {str(e)}"}
-    except Exception as e:
-        return {"error": f"Failed to create pivot table: {str(e)}"}
+    result: dict[str, Any] = create_pivot_table_impl(
+        filename=filename,
+        sheet_name=sheet_name,
+        data_range=data_range,
+        rows=rows,
+        values=values,
+        columns=columns or [],
+        agg_func=agg_func,
+    )
+    return result
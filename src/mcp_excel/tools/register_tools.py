@@ -6,15 +6,18 @@ with the FastMCP server. It provides a centralized location for tool management
 and ensures consistent registration patterns across all tool categories.
 
 Tool Categories:
-- Database Tools: PostgreSQL integration for data import/export
 - Content Tools: Data read/write operations for Excel files
 - Excel Tools: Basic workbook and worksheet operations
 - Format Tools: Cell styling, formatting, and layout operations
 - Formula Tools: Excel formula application and validation
 - Graphics Tools: Charts, pivot tables, and visual elements
+- Session Tools: In-memory workbook sessions for batched edits
 """
 
 import logging
+from collections.abc import Callable
+from types import ModuleType
+from typing import Any
 
 from mcp.server.fastmcp import FastMCP
 
@@ -24,187 +27,78 @@ from mcp_excel.tools import (
     format_tools,
     formulas_excel_tools,
     graphics_tools,
+    session_tools,
 )
 
 
 logger = logging.getLogger(__name__)
 
-
-def register_content_tools(mcp: FastMCP) -> list[str]:
-    """
-    Register content manipulation tools with the MCP server.
-
-    Args:
-        mcp: FastMCP server instance
-
-    Returns:
-        List[str]: Names of successfully registered content tools
-
-    Raises:
-        RuntimeError: If tool registration fails
-    """
-    tools = []
-    try:
-        # Content tools for data read/write operations
-        mcp.tool()(content_tools.read_data_from_excel)
-        tools.append("read_data_from_excel")
-
-        mcp.tool()(content_tools.write_data_to_excel)
-        tools.append("write_data_to_excel")
-
-        logger.info(f"Registered {len(tools)} content tools")
-        return tools
-
-    except Exception as e:
-        logger.error(f"Failed to register content tools: {e}")
-        raise RuntimeError(f"Content tool registration failed: {e}") from e
-
-
-def register_excel_tools(mcp: FastMCP) -> list[str]:
-    """
-    Register basic Excel workbook and worksheet tools with the MCP server.
-
-    Args:
-        mcp: FastMCP server instance
-
-    Returns:
-        List[str]: Names of successfully registered Excel tools
-
-    Raises:
-        RuntimeError: If tool registration fails
-    """
-    tools = []
-    try:
-        # Excel tools for basic workbook operations
-        mcp.tool()(excel_tools.create_excel_workbook)
-        tools.append("create_excel_workbook")
-
-        mcp.tool()(excel_tools.create_excel_worksheet)
-        tools.append("create_excel_worksheet")
-
-        mcp.tool()(excel_tools.list_excel_documents)
-        tools.append("list_excel_documents")
-
-        logger.info(f"Registered {len(tools)} Excel tools")
-        return tools
-
-    except Exception as e:
-        logger.error(f"Failed to register Excel tools: {e}")
-        raise RuntimeError(f"Excel tool registration failed: {e}") from e
-
-
-def register_format_tools(mcp: FastMCP) -> list[str]:
+ToolDecorator = Callable[[Callable[..., Any]], Callable[..., Any]]
+
+
+# Tool category -> (module, names of the tool functions it provides)
+TOOL_REGISTRY: dict[str, tuple[ModuleType, tuple[str, ...]]] = {
+    "Content": (
+        content_tools,
+        ("read_data_from_excel", "write_data_to_excel"),
+    ),
+    "Excel": (
+        excel_tools,
+        ("create_excel_workbook", "create_excel_worksheet", "list_excel_documents"),
+    ),
+    "Format": (
+        format_tools,
+        (
+            "format_range_excel",
+            "copy_worksheet",
+            "delete_worksheet",
+            "rename_worksheet",
+            "get_workbook_metadata",
+            "merge_cells",
+            "unmerge_cells",
+            "copy_range",
+            "delete_range",
+            "validate_excel_range",
+        ),
+    ),
+    "Formula": (
+        formulas_excel_tools,
+        ("validate_formula_syntax", "apply_formula_excel", "apply_formulas_batch"),
+    ),
+    "Graphics": (
+        graphics_tools,
+        ("create_chart", "create_pivot_table"),
+    ),
+    "Session": (
+        session_tools,
+        (
+            "open_workbook_session",
+            "commit_workbook_session",
+            "close_workbook_session",
+        ),
+    ),
+}
+
+
+def register_category_tools(
+    tool_decorator: ToolDecorator, module: ModuleType, names: tuple[str, ...]
+) -> list[str]:
     """
-    Register formatting and styling tools with the MCP server.
+    Register the tools of one category with the MCP server.
 
     Args:
-        mcp: FastMCP server instance
+        tool_decorator: Decorator returned by ``mcp.tool()``
+        module: Module that defines the tool functions
+        names: Names of the tool functions to register
 
     Returns:
-        List[str]: Names of successfully registered format tools
-
-    Raises:
-        RuntimeError: If tool registration fails
+        List[str]: Names of successfully registered tools
     """
     tools = []
-    try:
-        # Format tools for cell styling and layout
-        mcp.tool()(format_tools.format_range_excel)
-        tools.append("format_range_excel")
-
-        mcp.tool()(format_tools.copy_worksheet)
-        tools.append("copy_worksheet")
-
-        mcp.tool()(format_tools.delete_worksheet)
-        tools.append("delete_worksheet")
-
-        mcp.tool()(format_tools.rename_worksheet)
-        tools.append("rename_worksheet")
-
-        mcp.tool()(format_tools.get_workbook_metadata)
-        tools.append("get_workbook_metadata")
-
-        mcp.tool()(format_tools.merge_cells)
-        tools.append("merge_cells")
-
-        mcp.tool()(format_tools.unmerge_cells)
-        tools.append("unmerge_cells")
-
-        mcp.tool()(format_tools.copy_range)
-        tools.append("copy_range")
-
-        mcp.tool()(format_tools.delete_range)
-        tools.append("delete_range")
-
-        mcp.tool()(format_tools.validate_excel_range)
-        tools.append("validate_excel_range")
-
-        logger.info(f"Registered {len(tools)} format tools")
-        return tools
-
-    except Exception as e:
-        logger.error(f"Failed to register format tools: {e}")
-        raise RuntimeError(f"Format tool registration failed: {e}") from e
-
-
-def register_formula_tools(mcp: FastMCP) -> list[str]:
-    """
-    Register formula and calculation tools with the MCP server.
-
-    Args:
-        mcp: FastMCP server instance
-
-    Returns:
-        List[str]: Names of successfully registered formula tools
-
-    Raises:
-        RuntimeError: If tool registration fails
-    """
-    tools = []
-    try:
-        # Formula tools for Excel calculations
-        mcp.tool()(formulas_excel_tools.validate_formula_syntax)
-        tools.append("validate_formula_syntax")
-
-        mcp.tool()(formulas_excel_tools.apply_formula_excel)
-        tools.append("apply_formula_excel")
-
-        logger.info(f"Registered {len(tools)} formula tools")
-        return tools
-
-    except Exception as e:
-        logger.error(f"Failed to register formula tools: {e}")
-        raise RuntimeError(f"Formula tool registration failed: {e}") from e
-
-
-def register_graphics_tools(mcp: FastMCP) -> list[str]:
-    """
-    Register graphics and visualization tools with the MCP server.
-
-    Args:
-        mcp: FastMCP server instance
-
-    Returns:
-        List[str]: Names of successfully registered graphics tools
-
-    Raises:
-        RuntimeError: If tool registration fails
-    """
-    tools = []
-    try:
-        # Graphics tools for charts and pivot tables
-        mcp.tool()(graphics_tools.create_chart)
-        tools.append("create_chart")
-
-        mcp.tool()(graphics_tools.create_pivot_table)
-        tools.append("create_pivot_table")
-
-        logger.info(f"Registered {len(tools)} graphics tools")
-        return tools
-
-    except Exception as e:
-        logger.error(f"Failed to register graphics tools: {e}")
-        raise RuntimeError(f"Graphics tool registration failed: {e}") from e
+    for name in names:
+        tool_decorator(getattr(module, name))
+        tools.append(name)
+    return tools
 
 
 def register_all_tools(mcp: FastMCP) -> None:
@@ -224,30 +118,31 @@ def register_all_tools(mcp: FastMCP) -> None:
     logger.info("Starting tool registration process...")
 
     registered_tools = []
-    registration_functions = [
-        ("Content", register_content_tools),
-        ("Excel", register_excel_tools),
-        ("Format", register_format_tools),
-        ("Formula", register_formula_tools),
-        ("Graphics", register_graphics_tools),
-    ]
+    # mcp.tool() without arguments takes the name and description from each
+    # function, so one decorator instance serves every tool
+    tool_decorator = mcp.tool()
 
-    for category_name, register_func in registration_functions:
+    for category_name, (module, names) in TOOL_REGISTRY.items():
         try:
-            tools = register_func(mcp)
+            tools = register_category_tools(tool_decorator, module, names)
             registered_tools.extend(tools)
-            logger.info(
-                f"Successfully registered {category_name} tools: {', '.join(tools)}"
-            )
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "Successfully registered %s tools: %s",
+                    category_name,
+                    ", ".join(tools),
+                )
 
         except Exception as e:
-            logger.error(f"Failed to register {category_name} tools: {e}")
+            logger.error("Failed to register %s tools: %s", category_name, e)
             raise RuntimeError(f"{category_name} tool registration failed: {e}") from e
 
     logger.info(
-        f"Tool registration completed successfully. Total tools registered: {len(registered_tools)}"
+        "Tool registration completed successfully. Total tools registered: %d",
+        len(registered_tools),
     )
-    logger.info(f"Registered tools: {', '.join(registered_tools)}")
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Registered tools: %s", ", ".join(registered_tools))
 
     # Verify all tools are properly registered
     if len(registered_tools) == 0:
@@ -0,0 +1,76 @@
+from typing import Any
+
+from mcp_excel.core.session import close_session, commit_session, open_session
+from mcp_excel.exceptions.exception_core import SessionError, WorkbookError
+from mcp_excel.utils.file_utils import validate_file_access
+
+
+@validate_file_access("filename")
+async def open_workbook_session(filename: str) -> dict[str, Any]:
+    """Open an Excel workbook once and keep it in memory for a series of edits.
+
+    Context for AI/LLM:
+        Use this tool before applying many formatting, merge, copy, delete or formula operations to the same workbook. Pass the returned `session_id` to those tools so they edit the in-memory workbook instead of loading and saving the file on every call, then call `commit_workbook_session` or `close_workbook_session` to write the changes to disk.
+
+    Args:
+        filename (str): Path to the Excel workbook.
+
+    Returns:
+        dict[str, Any]: A status dictionary with the new `session_id` and the resolved file path.
+
+    Notes:
+        • Sessions left idle for 10 minutes are committed and closed automatically.
+        • Do not edit the same file without the `session_id` while the session is open. A commit refuses to overwrite a file that changed on disk since the session loaded it.
+    """
+    try:
+        result: dict[str, Any] = open_session(filename)
+        return result
+    except WorkbookError as e:
+        return {"status": "error", "message": "Error: " + str(e)}
+    except Exception as e:
+        return {"status": "error", "message": "Failed to open session: " + str(e)}
+
+
+async def commit_workbook_session(session_id: str) -> dict[str, Any]:
+    """Write the pending changes of a workbook session to disk and keep it open.
+
+    Context for AI/LLM:
+        Use this tool to checkpoint a long series of edits made through a session without ending it.
+
+    Args:
+        session_id (str): Id returned by `open_workbook_session`.
+
+    Returns:
+        dict[str, Any]: A status dictionary with the committed file path.
+    """
+    try:
+        result: dict[str, Any] = commit_session(session_id)
+        return result
+    except (SessionError, WorkbookError) as e:
+        return {"status": "error", "message": "Error: " + str(e)}
+    except Exception as e:
+        return {"status": "error", "message": "Failed to commit session: " + str(e)}
+
+
+async def close_workbook_session(
+    session_id: str, commit: bool = True
+) -> dict[str, Any]:
+    """Close a workbook session, writing its pending changes to disk first.
+
+    Context for AI/LLM:
+        Use this tool once all edits for a session are done. Set `commit` to False only to discard every change made since the last commit.
+
+    Args:
+        session_id (str): Id returned by `open_workbook_session`.
+        commit (bool, optional): Save pending changes before closing. Defaults to True.
+
+    Returns:
+        dict[str, Any]: A status dictionary indicating success or failure.
+    """
+    try:
+        result: dict[str, Any] = close_session(session_id, commit=commit)
+        return result
+    except (SessionError, WorkbookError) as e:
+        return {"status": "error", "message": "Error: " + str(e)}
+    except Exception as e:
+        return {"status": "error", "message": "Failed to close session: " + str(e)}
@@ -1,12 +1,14 @@
 from mcp_excel.utils.validation_utils import (
     validate_formula,
     validate_formula_in_cell_operation,
-    validate_formula_in_cell_operation as validate_formula_impl,
     validate_range_bounds,
     validate_range_in_sheet_operation,
 )
 
 
+# Backwards-compatible alias
+validate_formula_impl = validate_formula_in_cell_operation
+
 __all__ = [
     "validate_formula",
     "validate_formula_in_cell_operation",
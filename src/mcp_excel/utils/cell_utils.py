@@ -1,8 +1,24 @@
+import functools
 import re
+import string
 
 from openpyxl.utils import column_index_from_string
 
 
+_COLUMN_CHARS = frozenset(string.ascii_letters)
+_ROW_CHARS = frozenset(string.digits)
+_CELL_RE = re.compile(r"([A-Z]+)([0-9]+)", re.IGNORECASE | re.ASCII)
+
+# Cheap syntax checks for "A1" cells and "A1" / "A1:B2" ranges, for tools to
+# reject malformed input before opening the workbook. Use with fullmatch().
+_CELL_PATTERN = r"[A-Z]{1,3}[1-9]\d{0,6}"
+CELL_REFERENCE_RE = re.compile(_CELL_PATTERN, re.IGNORECASE)
+RANGE_REFERENCE_RE = re.compile(rf"{_CELL_PATTERN}(?::{_CELL_PATTERN})?", re.IGNORECASE)
+
+
+# Both functions are pure string work on a small set of repeating references
+# (the same "A1" shows up in many formulas and ranges), so results are cached.
+@functools.lru_cache(maxsize=4096)
 def parse_cell_range(
     cell_ref: str, end_ref: str | None = None
 ) -> tuple[int, int, int | None, int | None]:
@@ -17,7 +33,7 @@ def parse_cell_range(
         start_cell = cell_ref
         end_cell = None
 
-    match = re.match(r"([A-Z]+)([0-9]+)", start_cell.upper())
+    match = _CELL_RE.match(start_cell)
     if not match:
         raise ValueError(f"Invalid cell reference: {start_cell}")
     col_str, row_str = match.groups()
@@ -25,7 +41,7 @@ def parse_cell_range(
     start_col = column_index_from_string(col_str)
 
     if end_cell:
-        match = re.match(r"([A-Z]+)([0-9]+)", end_cell.upper())
+        match = _CELL_RE.match(end_cell)
         if not match:
             raise ValueError(f"Invalid cell reference: {end_cell}")
         col_str, row_str = match.groups()
@@ -40,19 +56,21 @@ def parse_cell_range(
 
 def validate_cell_reference(cell_ref: str) -> bool:
     """Validate Excel cell reference format (e.g., 'A1', 'BC123')"""
-    if not cell_ref:
+    # Checked before the cache so unhashable input cannot reach lru_cache
+    if not cell_ref or not isinstance(cell_ref, str):
         return False
+    return _validate_cell_reference_cached(cell_ref)
 
-    # Split into column and row parts
-    col = row = ""
-    for c in cell_ref:
-        if c.isalpha():
-            if row:  # Letters after numbers not allowed
-                return False
-            col += c
-        elif c.isdigit():
-            row += c
-        else:
-            return False
-
-    return bool(col and row)
+
+@functools.lru_cache(maxsize=4096)
+def _validate_cell_reference_cached(cell_ref: str) -> bool:
+    # Scan a run of 1-3 ASCII column letters, then digits to the end
+    n = len(cell_ref)
+    i = 0
+    while i < n and cell_ref[i] in _COLUMN_CHARS:
+        i += 1
+    if i == 0 or i > 3 or i == n:
+        return False
+    while i < n and cell_ref[i] in _ROW_CHARS:
+        i += 1
+    return i == n
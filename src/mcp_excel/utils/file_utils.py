@@ -7,11 +7,14 @@ all file operations are performed within authorized directories and with
 proper security validation.
 """
 
+import bisect
 import functools
 import inspect
 import os
 import shutil
+import stat
 from collections.abc import Callable
+from operator import itemgetter
 from pathlib import Path
 from typing import Any, TypeVar, cast
 
@@ -22,22 +25,32 @@ F = TypeVar("F", bound=Callable[..., Any])
 
 
 # Get allowed directories from configuration system
-def _get_allowed_directories() -> list[str]:
-    """Get the list of allowed directories from configuration system.
+def _get_allowed_directories() -> tuple[str, ...]:
+    """Get the allowed directories from configuration system.
 
     Uses Path.resolve() to properly resolve symlinks and normalize paths
     for enhanced security against path traversal attacks.
     """
     try:
         directory = get_directory()
-        # Use resolve() instead of abspath() to resolve symlinks
-        return [str(Path(directory).resolve())]
+        return _resolve_allowed_directories((directory,))
     except Exception:
         # Fallback to environment variable for backward compatibility
         allowed_dirs_str = os.environ.get("DIRECTORY", "./documents")
-        allowed_dirs = [dir.strip() for dir in allowed_dirs_str.split(",")]
-        # Use resolve() instead of abspath() to resolve symlinks
-        return [str(Path(dir).resolve()) for dir in allowed_dirs]
+        return _resolve_allowed_directories(
+            tuple(dir.strip() for dir in allowed_dirs_str.split(","))
+        )
+
+
+@functools.lru_cache(maxsize=8)
+def _resolve_allowed_directories(directories: tuple[str, ...]) -> tuple[str, ...]:
+    """Resolve the configured directories once per distinct setting.
+
+    The key is the configured value itself, so changing the configuration
+    or the DIRECTORY variable resolves the new directories on the next call.
+    """
+    # Use resolve() instead of abspath() to resolve symlinks
+    return tuple(str(Path(dir).resolve()) for dir in directories)
 
 
 # Check if the given file path is within allowed directories
@@ -47,26 +60,55 @@ def _is_path_in_allowed_directories(file_path: str) -> tuple[bool, str | None]:
     Uses Path.resolve() to properly resolve symlinks before validation,
     preventing symlink-based path traversal attacks.
     """
-    allowed_dirs = _get_allowed_directories()
     # Use resolve() instead of abspath() to resolve symlinks and normalize path
-    resolved_path = Path(file_path).resolve()
+    return _is_resolved_path_allowed(Path(file_path).resolve(), file_path)
 
-    for allowed_dir in allowed_dirs:
-        allowed_path = Path(allowed_dir).resolve()
-        try:
-            # Check if resolved path is relative to allowed directory
-            resolved_path.relative_to(allowed_path)
-            return True, None
-        except ValueError:
-            # Path is not within this allowed directory
-            continue
 
+def _is_resolved_path_allowed(
+    resolved_path: Path, file_path: str | Path | None = None
+) -> tuple[bool, str | None]:
+    """Check an already resolved path against the allowed directories.
+
+    Lets callers that resolved the path themselves skip a second resolve().
+    """
+    allowed_dirs = _get_allowed_directories()
+
+    # Plain prefix test against the resolved directories plus a separator, so
+    # "/data/docs" allows "/data/docs/a.xlsx" but not "/data/docs2/a.xlsx".
+    # The prefixes are sorted and never nested, so the only candidate is the
+    # greatest prefix not after the path.
+    path_str = os.path.normcase(str(resolved_path)) + os.sep
+    prefixes = _allowed_prefixes(tuple(allowed_dirs))
+    index = bisect.bisect_right(prefixes, path_str) - 1
+    if index >= 0 and path_str.startswith(prefixes[index]):
+        return True, None
+
+    if file_path is None:
+        file_path = resolved_path
     return (
         False,
         f"Path '{file_path}' (resolved: '{resolved_path}') is not in allowed directories: {', '.join(allowed_dirs)}",
     )
 
 
+@functools.lru_cache(maxsize=8)
+def _allowed_prefixes(allowed_dirs: tuple[str, ...]) -> tuple[str, ...]:
+    """Resolved allowed directories in normalized case, ending in a separator.
+
+    The result is sorted, and directories inside another allowed directory
+    are dropped because the outer one already admits them.
+    """
+    candidates = []
+    for allowed_dir in _resolve_allowed_directories(allowed_dirs):
+        prefix = os.path.normcase(allowed_dir)
+        candidates.append(prefix if prefix.endswith(os.sep) else prefix + os.sep)
+    prefixes: list[str] = []
+    for prefix in sorted(candidates):
+        if not prefixes or not prefix.startswith(prefixes[-1]):
+            prefixes.append(prefix)
+    return tuple(prefixes)
+
+
 def resolve_safe_path(filename: str | Path) -> Path:
     """Resolve file path to an allowed directory.
     Args:
@@ -82,15 +124,12 @@ def resolve_safe_path(filename: str | Path) -> Path:
     if not allowed_dirs:
         raise PermissionError("No allowed directories available for file operations")
 
-    # If absolute path, validate it's in an allowed directory
+    # If absolute path, validate it's in an allowed directory. The path is
+    # resolved once and checked against the cached directory prefixes.
     if path.is_absolute():
-        for allowed_dir in allowed_dirs:
-            try:
-                # Check if the path is within an allowed directory
-                path.resolve().relative_to(Path(allowed_dir).resolve())
-                return path  # Path is allowed
-            except ValueError:
-                continue  # Path is not within this allowed directory
+        is_allowed, _ = _is_resolved_path_allowed(path.resolve())
+        if is_allowed:
+            return path
 
         # If not in any allowed directory, use filename in first allowed dir
         return Path(allowed_dirs[0]) / path.name
@@ -120,33 +159,57 @@ def _check_file_writeable(filename: str) -> tuple[bool, str | None]:
     try:
         # Normalize and get resolved path (resolves symlinks)
         resolved_path = Path(filename).resolve()
-        parent_dir = resolved_path.parent
 
         # Check if path is in allowed directories
-        is_allowed, error = _is_path_in_allowed_directories(str(resolved_path))
+        is_allowed, error = _is_resolved_path_allowed(resolved_path)
         if not is_allowed:
             return False, error
 
+        return _check_resolved_path_writeable(
+            resolved_path, _stat_or_none(resolved_path)
+        )
+
+    except Exception as e:
+        return False, f"Error checking file write permissions: {str(e)}"
+
+
+def _stat_or_none(path: Path) -> os.stat_result | None:
+    """Stat a path, returning None if it does not exist."""
+    try:
+        return path.stat()
+    except FileNotFoundError:
+        return None
+
+
+def _check_resolved_path_writeable(
+    resolved_path: Path, file_stat: os.stat_result | None
+) -> tuple[bool, str | None]:
+    """Check write permissions of an already resolved and allowed path.
+
+    Args:
+        resolved_path: Path returned by Path.resolve()
+        file_stat: Stat result of resolved_path, or None if it doesn't exist
+
+    Returns:
+        tuple[bool, str]: (success, error_message) as in _check_file_writeable()
+    """
+    try:
         # If file exists, check write permissions
-        if resolved_path.exists():
-            if resolved_path.is_dir():
+        if file_stat is not None:
+            if stat.S_ISDIR(file_stat.st_mode):
                 return False, f"Path is a directory: {resolved_path}"
             if not os.access(resolved_path, os.W_OK):
                 return False, f"Permission denied: {resolved_path}"
-        # If file doesn't exist, check parent directory
+        # If file doesn't exist, check parent directory. Nothing is created
+        # here, so a new workbook is not left behind as an empty file.
         else:
+            parent_dir = resolved_path.parent
             if not parent_dir.exists():
                 return False, f"Directory does not exist: {parent_dir}"
             if not os.access(parent_dir, os.W_OK):
                 return False, f"Directory not writeable: {parent_dir}"
 
-        # Test actual write operation
-        try:
-            with open(resolved_path, "a"):
-                pass
-            return True, ""
-        except OSError as e:
-            return False, f"Write test failed: {str(e)}"
+        return True, ""
 
     except Exception as e:
         return False, f"Error checking file write permissions: {str(e)}"
@@ -166,7 +229,8 @@ def create_document_copy(
     Returns:
         Tuple of (success, message, new_filepath)
     """
-    if not os.path.exists(source_path):
+    source_stat = _stat_or_none(Path(source_path))
+    if source_stat is None:
         return False, f"Source document {source_path} does not exist", None
 
     if not dest_path:
@@ -175,14 +239,17 @@ def create_document_copy(
         dest_path = f"{base}_copy{ext}"
 
     try:
-        # Simple file copy
-        shutil.copy2(source_path, dest_path)
+        # Copy the data (zero-copy where the OS supports it) and the
+        # permission bits; timestamps and extended attributes are not needed
+        shutil.copyfile(source_path, dest_path)
+        os.chmod(dest_path, stat.S_IMODE(source_stat.st_mode))
         return True, f"Document copied to {dest_path}", dest_path
     except Exception as e:
         return False, f"Failed to copy document: {str(e)}", None
 
 
 #! Ensure filename has .xlsx extension
+@functools.lru_cache(maxsize=1024)
 def ensure_xlsx_extension(filename: str) -> str:
     """
     Ensure filename has .xlsx extension.
@@ -191,13 +258,29 @@ def ensure_xlsx_extension(filename: str) -> str:
         filename: The filename to check
 
     Returns:
-        Filename with .xlsx extension
+        Filename with .xlsx extension (an existing .XLSX suffix is kept as is)
     """
-    if not filename.endswith(".xlsx"):
+    if filename[-5:].lower() != ".xlsx":
         return filename + ".xlsx"
     return filename
 
 
+def resolve_xlsx(filename: str | Path) -> tuple[Path, os.stat_result | None]:
+    """
+    Normalize the .xlsx extension, resolve the path and stat it once.
+
+    Args:
+        filename: File name or path, with or without the .xlsx extension
+
+    Returns:
+        tuple[Path, os.stat_result | None]: The resolved path and its stat
+            result, or None if the file does not exist
+    """
+    # Use resolve() instead of abspath() to resolve symlinks and normalize path
+    resolved_path = Path(ensure_xlsx_extension(str(filename))).resolve()
+    return resolved_path, _stat_or_none(resolved_path)
+
+
 # * Retrieve metadata for all Excel (.xlsx) files in the specified directory
 def list_excel_files_in_directory() -> list[dict]:
     """
@@ -222,33 +305,48 @@ def list_excel_files_in_directory() -> list[dict]:
         raise ConfigurationError(f"Failed to get configured directory: {e}") from e
 
     try:
-        # Validate directory exists and is accessible
-        if not os.path.exists(directory):
-            raise FileNotFoundError(f"Configured directory not found: {directory}")
-        if not os.path.isdir(directory):
+        # Validate directory exists and is accessible, with a single stat
+        try:
+            dir_stat = os.stat(directory)
+        except FileNotFoundError:
+            raise FileNotFoundError(  # noqa: B904
+                f"Configured directory not found: {directory}"
+            )
+        if not stat.S_ISDIR(dir_stat.st_mode):
             raise NotADirectoryError(f"Configured path is not a directory: {directory}")
 
-        excel_files = []
+        # (sort key, name, size_kb, modified, path); dicts are built after sorting
+        rows: list[tuple[str, str, float, float, str]] = []
 
         # Use listdir with absolute paths for better error handling
         with os.scandir(directory) as entries:
             for entry in entries:
                 try:
-                    if entry.is_file() and entry.name.lower().endswith(".xlsx"):
-                        stat = entry.stat()
-                        excel_files.append(
-                            {
-                                "filename": entry.name,
-                                "size_kb": round(stat.st_size / 1024, 2),
-                                "modified": stat.st_mtime,
-                                "path": entry.path,
-                            }
+                    # Cheap name test first; symlinks are not followed, so the
+                    # stat describes the entry itself and is free on Windows
+                    name_key = entry.name.lower()
+                    if name_key.endswith(".xlsx") and entry.is_file(
+                        follow_symlinks=False
+                    ):
+                        file_stat = entry.stat(follow_symlinks=False)
+                        rows.append(
+                            (
+                                name_key,
+                                entry.name,
+                                round(file_stat.st_size / 1024, 2),
+                                file_stat.st_mtime,
+                                entry.path,
+                            )
                         )
                 except (OSError, PermissionError):
                     # Skip files we can't access but continue with others
                     continue
 
-        return sorted(excel_files, key=lambda x: x["filename"].lower())
+        rows.sort(key=itemgetter(0))
+        return [
+            {"filename": name, "size_kb": size_kb, "modified": modified, "path": path}
+            for _, name, size_kb, modified, path in rows
+        ]
 
     except OSError as e:
         # Re-raise with more context
@@ -261,6 +359,7 @@ def list_excel_files_in_directory() -> list[dict]:
 def validate_file_access(param: str = "filename") -> Callable[[F], F]:
     """
     Decorator to validate file access before executing the decorated function.
+    - Adds the .xlsx extension to the file parameter if it is missing.
     - Verifies that the file is in an allowed directory.
     - Verifies that it has write permissions.
 
@@ -272,25 +371,61 @@ def validate_file_access(param: str = "filename") -> Callable[[F], F]:
     """
 
     def decorator(func: F) -> F:
+        # Inspect the signature once; most calls then find the parameter
+        # directly in kwargs or at its position without binding
+        sig = inspect.signature(func)
+        param_index = -1
+        if param in sig.parameters and sig.parameters[param].kind in (
+            inspect.Parameter.POSITIONAL_ONLY,
+            inspect.Parameter.POSITIONAL_OR_KEYWORD,
+        ):
+            param_index = list(sig.parameters).index(param)
+
+        def _locate_param(
+            args: tuple[Any, ...], kwargs: dict[str, Any]
+        ) -> tuple[str, tuple[Any, ...], dict[str, Any]] | None:
+            """Return the normalized file name and the args and kwargs using it."""
+            if param in kwargs:
+                filename = ensure_xlsx_extension(str(kwargs[param]))
+                return filename, args, {**kwargs, param: filename}
+            if 0 <= param_index < len(args):
+                filename = ensure_xlsx_extension(str(args[param_index]))
+                new_args = list(args)
+                new_args[param_index] = filename
+                return filename, tuple(new_args), kwargs
+
+            # Defaults, missing arguments and other unusual calls
+            bound = sig.bind(*args, **kwargs)
+            bound.apply_defaults()
+            if param not in bound.arguments:
+                return None
+            filename = ensure_xlsx_extension(str(bound.arguments[param]))
+            bound.arguments[param] = filename
+            return filename, bound.args, bound.kwargs
+
         def _validate_file(
             args: tuple[Any, ...], kwargs: dict[str, Any]
-        ) -> str | dict[str, str]:
+        ) -> tuple[str, tuple[Any, ...], dict[str, Any]] | dict[str, str]:
             try:
-                sig = inspect.signature(func)
-                bound = sig.bind(*args, **kwargs)
-                bound.apply_defaults()
-
-                if param not in bound.arguments:
+                # Hand the wrapped function the name with its .xlsx extension
+                # so tool bodies do not normalize it again
+                located = _locate_param(args, kwargs)
+                if located is None:
                     return {
                         "status": "error",
                         "message": f"'{param}' parameter not found in function arguments",
                     }
+                filename, args, kwargs = located
 
-                # Use resolve() instead of abspath() to resolve symlinks and normalize path
-                file_path: str = str(Path(bound.arguments[param]).resolve())
+                # Resolve and stat once, then reuse the result for both the
+                # directory check and the write check
+                resolved_path, file_stat = resolve_xlsx(filename)
+                file_path: str = str(resolved_path)
 
                 # Validate allowed directory
-                is_allowed, dir_error = _is_path_in_allowed_directories(file_path)
+                is_allowed, dir_error = _is_resolved_path_allowed(
+                    resolved_path, file_path
+                )
                 if not is_allowed:
                     return {
                         "status": "error",
@@ -299,7 +434,9 @@ def validate_file_access(param: str = "filename") -> Callable[[F], F]:
                     }
 
                 # Validate write permissions
-                is_writable, write_error = _check_file_writeable(file_path)
+                is_writable, write_error = _check_resolved_path_writeable(
+                    resolved_path, file_stat
+                )
                 if not is_writable:
                     return {
                         "status": "error",
@@ -307,7 +444,7 @@ def validate_file_access(param: str = "filename") -> Callable[[F], F]:
                         "path": file_path,
                     }
 
-                return file_path
+                return file_path, args, kwargs
 
             except Exception as e:
                 return {
@@ -322,13 +459,14 @@ def validate_file_access(param: str = "filename") -> Callable[[F], F]:
                 result = _validate_file(args, kwargs)
                 if isinstance(result, dict):
                     return result
+                file_path, args, kwargs = result
                 try:
                     return await func(*args, **kwargs)
                 except Exception as e:
                     return {
                         "status": "error",
                         "message": f"Error in async function: {str(e)}",
-                        "path": result,
+                        "path": file_path,
                     }
 
             return cast(F, async_wrapper)
@@ -340,13 +478,14 @@ def validate_file_access(param: str = "filename") -> Callable[[F], F]:
                 result = _validate_file(args, kwargs)
                 if isinstance(result, dict):
                     return result
+                file_path, args, kwargs = result
                 try:
                     return func(*args, **kwargs)
                 except Exception as e:
                     return {
                         "status": "error",
                         "message": f"Error in function: {str(e)}",
-                        "path": result,
+                        "path": file_path,
                     }
 
             return cast(F, sync_wrapper)
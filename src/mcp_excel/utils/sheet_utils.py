@@ -1,6 +1,6 @@
 from typing import Any
 
-from openpyxl import load_workbook
+from openpyxl import Workbook, load_workbook
 from openpyxl.styles import Alignment, Border, Font, PatternFill, Side
 from openpyxl.utils import column_index_from_string, get_column_letter
 from openpyxl.worksheet.worksheet import Worksheet
@@ -197,11 +197,18 @@ def delete_range(
 
 
 def merge_range(
-    filename: str, sheet_name: str, start_cell: str, end_cell: str
+    filename: str,
+    sheet_name: str,
+    start_cell: str,
+    end_cell: str,
+    workbook: Workbook | None = None,
 ) -> dict[str, Any]:
-    """Merge a range of cells."""
+    """Merge a range of cells.
+
+    If ``workbook`` is given it is modified in place and not saved.
+    """
     try:
-        wb = load_workbook(filename)
+        wb = workbook if workbook is not None else load_workbook(filename)
         if sheet_name not in wb.sheetnames:
             return {"error": f"Sheet '{sheet_name}' not found"}
         start_row, start_col, end_row, end_col = parse_cell_range(start_cell, end_cell)
@@ -210,18 +217,26 @@ def merge_range(
         range_string = format_range_string(start_row, start_col, end_row, end_col)
         worksheet = wb[sheet_name]
         worksheet.merge_cells(range_string)
-        wb.save(filename)
+        if workbook is None:
+            wb.save(filename)
         return {"message": f"Range '{range_string}' merged in sheet '{sheet_name}'"}
     except Exception as e:
         return {"error": str(e)}
 
 
 def unmerge_range(
-    filename: str, sheet_name: str, start_cell: str, end_cell: str
+    filename: str,
+    sheet_name: str,
+    start_cell: str,
+    end_cell: str,
+    workbook: Workbook | None = None,
 ) -> dict[str, Any]:
-    """Unmerge a range of cells."""
+    """Unmerge a range of cells.
+
+    If ``workbook`` is given it is modified in place and not saved.
+    """
     try:
-        wb = load_workbook(filename)
+        wb = workbook if workbook is not None else load_workbook(filename)
         if sheet_name not in wb.sheetnames:
             return {"error": f"Sheet '{sheet_name}' not found"}
         worksheet = wb[sheet_name]
@@ -236,7 +251,8 @@ def unmerge_range(
         ):
             return {"error": f"Range '{range_string}' is not merged"}
         worksheet.unmerge_cells(range_string)
-        wb.save(filename)
+        if workbook is None:
+            wb.save(filename)
         return {"message": f"Range '{range_string}' unmerged successfully"}
     except Exception as e:
         return {"error": str(e)}
@@ -249,10 +265,14 @@ def copy_range_operation(
     source_end: str,
     target_start: str,
     target_sheet: str | None = None,
+    workbook: Workbook | None = None,
 ) -> dict[str, Any]:
-    """Copy a range of cells to another location."""
+    """Copy a range of cells to another location.
+
+    If ``workbook`` is given it is modified in place and not saved.
+    """
     try:
-        wb = load_workbook(filename)
+        wb = workbook if workbook is not None else load_workbook(filename)
         if sheet_name not in wb.sheetnames:
             return {"error": f"Sheet '{sheet_name}' not found"}
         source_ws = wb[sheet_name]
@@ -317,7 +337,8 @@ def copy_range_operation(
                             justifyLastLine=align.justifyLastLine,
                             readingOrder=align.readingOrder,
                         )
-        wb.save(filename)
+        if workbook is None:
+            wb.save(filename)
         return {"message": "Range copied successfully"}
     except Exception as e:
         return {"error": f"Failed to copy range: {str(e)}"}
@@ -329,9 +350,14 @@ def delete_range_operation(
     start_cell: str,
     end_cell: str | None = None,
     shift_direction: str = "up",
+    workbook: Workbook | None = None,
 ) -> dict[str, Any]:
+    """Delete a range of cells and shift the remaining cells.
+
+    If ``workbook`` is given it is modified in place and not saved.
+    """
     try:
-        wb = load_workbook(filename)
+        wb = workbook if workbook is not None else load_workbook(filename)
         if sheet_name not in wb.sheetnames:
             return {"error": f"Sheet '{sheet_name}' not found"}
         worksheet = wb[sheet_name]
@@ -361,7 +387,8 @@ def delete_range_operation(
             worksheet.delete_rows(start_row, (end_row or start_row) - start_row + 1)
         elif shift_direction == "left":
             worksheet.delete_cols(start_col, (end_col or start_col) - start_col + 1)
-        wb.save(filename)
+        if workbook is None:
+            wb.save(filename)
         return {"message": f"Range {range_string} deleted successfully"}
     except Exception as e:
         return {"error": str(e)}
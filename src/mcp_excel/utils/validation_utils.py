@@ -1,7 +1,8 @@
+import functools
 import re
 from typing import Any
 
-from openpyxl import load_workbook
+from openpyxl import Workbook, load_workbook
 from openpyxl.utils import get_column_letter
 from openpyxl.worksheet.worksheet import Worksheet
 
@@ -9,14 +10,27 @@ from mcp_excel.utils.cell_utils import parse_cell_range, validate_cell_reference
 
 
 def validate_formula_in_cell_operation(
-    filepath: str, sheet_name: str, cell: str, formula: str
+    filepath: str,
+    sheet_name: str,
+    cell: str,
+    formula: str,
+    workbook: Workbook | None = None,
 ) -> dict[str, Any]:
     # Quick validations
     if not validate_cell_reference(cell):
         return {"status": "error", "message": f"Invalid cell reference: {cell}"}
     try:
-        wb = load_workbook(filepath)
-        if sheet_name not in wb.sheetnames:
+        # Reuse a caller-supplied workbook instead of loading the file again.
+        # Only the sheet names are needed, so a fresh load is read-only.
+        if workbook is not None:
+            sheet_names = workbook.sheetnames
+        else:
+            wb = load_workbook(filepath, read_only=True, keep_links=False)
+            try:
+                sheet_names = wb.sheetnames
+            finally:
+                wb.close()
+        if sheet_name not in sheet_names:
             return {"status": "error", "message": f"Sheet '{sheet_name}' not found"}
         # Validate formula syntax
         result: tuple[bool, str] = validate_formula(formula)
@@ -24,23 +38,22 @@ def validate_formula_in_cell_operation(
         if not is_valid:
             return {"status": "error", "message": f"Invalid formula syntax: {message}"}
         # Validate cell references in the formula
-        cell_refs = re.findall(r"[A-Z]+[0-9]+(?::[A-Z]+[0-9]+)?", formula)
+        _, _, cell_refs = _tokenize(formula[1:])
+        # The scan only yields well-formed "A1" shapes, so what is left to
+        # check is that they fit on an Excel sheet
         for ref in cell_refs:
-            if ":" in ref:
-                start, end = ref.split(":")
-                if not (
-                    validate_cell_reference(start) and validate_cell_reference(end)
-                ):
+            start, _, end = ref.partition(":")
+            if end:
+                if not (_cell_in_bounds(start) and _cell_in_bounds(end)):
                     return {
                         "status": "error",
                         "message": f"Invalid cell range reference in formula: {ref}",
                     }
-            else:
-                if not validate_cell_reference(ref):
-                    return {
-                        "status": "error",
-                        "message": f"Invalid cell reference in formula: {ref}",
-                    }
+            elif not _cell_in_bounds(ref):
+                return {
+                    "status": "error",
+                    "message": f"Invalid cell reference in formula: {ref}",
+                }
 
         # All validations passed - formula is valid and can be applied
         return {
@@ -68,10 +81,17 @@ def validate_range_in_sheet_operation(
     if end_cell and not validate_cell_reference(end_cell):
         return {"status": "error", "message": f"Invalid end cell reference: {end_cell}"}
     try:
-        wb = load_workbook(filepath)
+        # Only the sheet dimensions are read, so skip loading the cells
+        wb = load_workbook(filepath, read_only=True, keep_links=False)
+    except Exception as e:
+        return {"status": "error", "message": str(e)}
+    try:
         if sheet_name not in wb.sheetnames:
             return {"status": "error", "message": f"Sheet '{sheet_name}' not found"}
         worksheet = wb[sheet_name]
+        if worksheet.max_row is None or worksheet.max_column is None:
+            # The file has no <dimension> record, so scan the rows once
+            worksheet.calculate_dimension(force=True)
         data_max_row = worksheet.max_row
         data_max_col = worksheet.max_column
         try:
@@ -110,27 +130,86 @@ def validate_range_in_sheet_operation(
         }
     except Exception as e:
         return {"status": "error", "message": str(e)}
+    finally:
+        # Read-only workbooks keep the archive open until closed
+        wb.close()
 
 
-def validate_formula(formula: str) -> tuple[bool, str]:
-    if not formula.startswith("="):
-        return False, "Formula must start with '='"
-    formula = formula[1:]
+# Function names, cell references and parentheses in one scan. String
+# literals are matched as a whole so their contents are never mistaken for
+# any of these. Function names may contain digits (LOG10, ATAN2), which keeps
+# them from being read as cell references.
+_FORMULA_TOKEN_RE = re.compile(
+    r'"(?:[^"]|"")*"'
+    r"|(?P<func>[A-Z][A-Z0-9.]*)\("
+    r"|(?P<ref>[A-Z]+[0-9]+(?::[A-Z]+[0-9]+)?)"
+    r"|(?P<paren>[()])"
+)
+
+# Largest column (XFD) and row on an Excel sheet
+_MAX_COLUMN = 16384
+_MAX_ROW = 1048576
+
+# Functions rejected by validate_formula
+_UNSAFE_FUNCS = frozenset({"INDIRECT", "HYPERLINK", "WEBSERVICE", "DGET", "RTD"})
+
+
+@functools.lru_cache(maxsize=4096)
+def _tokenize(formula: str) -> tuple[str | None, tuple[str, ...], tuple[str, ...]]:
+    """Check parentheses and extract function names and cell references.
+
+    The formula body is walked once. Returns an error message (None if the
+    parentheses balance), the function names and the cell references.
+    Cached by formula text, since the same template formula is usually
+    validated again and again for different cells.
+    """
+    funcs: list[str] = []
+    cell_refs: list[str] = []
     parens = 0
-    for c in formula:
-        if c == "(":
+    for match in _FORMULA_TOKEN_RE.finditer(formula):
+        if match["func"]:
+            funcs.append(match["func"])
             parens += 1
-        elif c == ")":
+        elif match["ref"]:
+            cell_refs.append(match["ref"])
+        elif match["paren"] == "(":
+            parens += 1
+        elif match["paren"] == ")":
             parens -= 1
-        if parens < 0:
-            return False, "Unmatched closing parenthesis"
+            if parens < 0:
+                return "Unmatched closing parenthesis", (), ()
     if parens > 0:
-        return False, "Unclosed parenthesis"
-    func_pattern = r"([A-Z]+)\("
-    funcs = re.findall(func_pattern, formula)
-    unsafe_funcs = {"INDIRECT", "HYPERLINK", "WEBSERVICE", "DGET", "RTD"}
+        return "Unclosed parenthesis", (), ()
+    return None, tuple(funcs), tuple(cell_refs)
+
+
+def _cell_in_bounds(cell: str) -> bool:
+    """Check an uppercase "A1" style reference against the sheet limits."""
+    column = 0
+    for index, char in enumerate(cell):
+        if char.isdigit():
+            return column <= _MAX_COLUMN and 1 <= int(cell[index:]) <= _MAX_ROW
+        column = column * 26 + ord(char) - 64
+    return False
+
+
+def validate_formula(formula: object) -> tuple[bool, str]:
+    # Checked before the cache so unhashable input cannot reach lru_cache
+    if not isinstance(formula, str):
+        return False, "Formula must be a string"
+    return _validate_formula_cached(formula)
+
+
+@functools.lru_cache(maxsize=1024)
+def _validate_formula_cached(formula: str) -> tuple[bool, str]:
+    if not formula.startswith("="):
+        return False, "Formula must start with '='"
+    error, funcs, _ = _tokenize(formula[1:])
+    if error is not None:
+        return False, error
     for func in funcs:
-        if func in unsafe_funcs:
+        # Prefixed names such as _XLFN.WEBSERVICE are matched by their last part
+        if func.rsplit(".", 1)[-1] in _UNSAFE_FUNCS:
             return False, f"Unsafe function: {func}"
     return True, "Formula is valid"
 
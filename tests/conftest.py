@@ -31,82 +31,95 @@ def test_config(tmp_path) -> Generator[ConfigurationManager, None, None]:
         manager._config = original_config
 
 
-@pytest.fixture
-def test_excel_file(tmp_path) -> str:
-    """Create a test Excel file in the temporary directory."""
-    import openpyxl
-
-    # Configure test environment
+@pytest.fixture(scope="module")
+def cfg_manager(tmp_path_factory) -> Generator[ConfigurationManager, None, None]:
+    """Point the configuration at one directory for a whole test module."""
     manager = ConfigurationManager()
-    manager.reload_configuration(directory=str(tmp_path), log_level="INFO")
+    original_config = manager.config
+
+    try:
+        directory = tmp_path_factory.mktemp("documents")
+        manager.reload_configuration(directory=str(directory), log_level="INFO")
+        yield manager
+    finally:
+        manager._config = original_config
+
+
+@pytest.fixture(scope="session")
+def excel_file_template(tmp_path_factory) -> Path:
+    """Build the single-sheet test workbook once per test session."""
+    import openpyxl
 
-    # Create a test workbook
     wb = openpyxl.Workbook()
     ws = wb.active
     ws.title = "Sheet1"
 
     # Add some test data
-    test_data = [
+    for row in [
         ["Name", "Age", "City"],
         ["Alice", 30, "New York"],
         ["Bob", 25, "Los Angeles"],
         ["Charlie", 35, "Chicago"],
-    ]
+    ]:
+        ws.append(row)
 
-    for row_idx, row_data in enumerate(test_data, 1):
-        for col_idx, value in enumerate(row_data, 1):
-            ws.cell(row=row_idx, column=col_idx, value=value)
+    template_path = tmp_path_factory.mktemp("templates") / "test_file.xlsx"
+    wb.save(template_path)
+    return template_path
 
-    # Save to tmp_path directory
-    test_file_path = tmp_path / "test_file.xlsx"
-    wb.save(test_file_path)
-
-    return str(test_file_path)
 
-
-@pytest.fixture
-def test_workbook_file(tmp_path) -> str:
-    """Create a test workbook file in the temporary directory."""
+@pytest.fixture(scope="session")
+def workbook_file_template(tmp_path_factory) -> Path:
+    """Build the multi-sheet test workbook once per test session."""
     import openpyxl
 
-    # Configure test environment
-    manager = ConfigurationManager()
-    manager.reload_configuration(directory=str(tmp_path), log_level="INFO")
-
-    # Create a test workbook with multiple sheets
     wb = openpyxl.Workbook()
 
     # First sheet with data
     ws1 = wb.active
     ws1.title = "Data"
-    data = [
+    for row in [
         ["Product", "Sales", "Region"],
         ["Widget A", 100, "North"],
         ["Widget B", 150, "South"],
         ["Widget C", 200, "East"],
-    ]
-
-    for row_idx, row_data in enumerate(data, 1):
-        for col_idx, value in enumerate(row_data, 1):
-            ws1.cell(row=row_idx, column=col_idx, value=value)
+    ]:
+        ws1.append(row)
 
     # Second sheet for formulas
     ws2 = wb.create_sheet("Formulas")
     ws2["A1"] = "Total Sales"
     ws2["B1"] = "=SUM(Data.B2:B4)"
 
-    # Save to tmp_path directory
-    test_file_path = tmp_path / "test_workbook.xlsx"
-    wb.save(test_file_path)
+    template_path = tmp_path_factory.mktemp("templates") / "test_workbook.xlsx"
+    wb.save(template_path)
+    return template_path
+
+
+@pytest.fixture
+def test_excel_file(tmp_path, excel_file_template: Path) -> str:
+    """Create a test Excel file in the temporary directory."""
+    # Configure test environment
+    manager = ConfigurationManager()
+    manager.reload_configuration(directory=str(tmp_path), log_level="INFO")
+
+    # Copy the session template instead of rebuilding the workbook
+    test_file_path = tmp_path / "test_file.xlsx"
+    shutil.copyfile(excel_file_template, test_file_path)
 
     return str(test_file_path)
 
 
-@pytest.fixture(autouse=True)
-def setup_test_documents(tmp_path) -> None:
-    """Copy test documents to the test directory if they exist."""
-    source_docs = Path("documents")
-    if source_docs.exists():
-        for doc_file in source_docs.glob("*.xlsx"):
-            target_file = tmp_path / doc_file.name
-            shutil.copy2(doc_file, target_file)
+@pytest.fixture
+def test_workbook_file(tmp_path, workbook_file_template: Path) -> str:
+    """Create a test workbook file in the temporary directory."""
+    # Configure test environment
+    manager = ConfigurationManager()
+    manager.reload_configuration(directory=str(tmp_path), log_level="INFO")
+
+    # Copy the session template instead of rebuilding the workbook
+    test_file_path = tmp_path / "test_workbook.xlsx"
+    shutil.copyfile(workbook_file_template, test_file_path)
+
+    return str(test_file_path)
+
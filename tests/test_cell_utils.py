@@ -2,7 +2,13 @@
 
 import pytest
 
-from mcp_excel.utils.cell_utils import parse_cell_range, validate_cell_reference
+from mcp_excel.utils.cell_utils import (
+    _validate_cell_reference_cached,
+    CELL_REFERENCE_RE,
+    RANGE_REFERENCE_RE,
+    parse_cell_range,
+    validate_cell_reference,
+)
 
 
 class TestParseCellRange:
@@ -112,13 +118,10 @@ class TestValidateCellReference:
         result = validate_cell_reference("1A")
         assert result is False
 
-    def test_invalid_special_characters(self) -> None:
+    @pytest.mark.parametrize("ref", ["A-1", "A_1", "A+1", "@1", "#REF!", "$A$1"])
+    def test_invalid_special_characters(self, ref: str) -> None:
         """Test validating cell with special characters."""
-        invalid_refs = ["A-1", "A_1", "A+1", "@1", "#REF!", "$A$1"]
-        for ref in invalid_refs:
-            assert validate_cell_reference(ref) is False, (
-                f"Expected {ref} to be invalid"
-            )
+        assert validate_cell_reference(ref) is False
 
     def test_invalid_only_letters(self) -> None:
         """Test validating reference with only letters."""
@@ -130,13 +133,10 @@ class TestValidateCellReference:
         result = validate_cell_reference("123")
         assert result is False
 
-    def test_invalid_mixed_format(self) -> None:
+    @pytest.mark.parametrize("ref", ["A1B2", "12A34", "A 1", "A-1:C2"])
+    def test_invalid_mixed_format(self, ref: str) -> None:
         """Test validating various invalid formats."""
-        invalid_refs = ["A1B2", "12A34", "A 1", "A-1:C2"]
-        for ref in invalid_refs:
-            assert validate_cell_reference(ref) is False, (
-                f"Expected {ref} to be invalid"
-            )
+        assert validate_cell_reference(ref) is False
 
     def test_valid_lowercase(self) -> None:
         """Test validating lowercase cell reference."""
@@ -147,3 +147,50 @@ class TestValidateCellReference:
         """Test validating mixed case cell reference."""
         result = validate_cell_reference("Aa1")
         assert result is True
+
+    def test_repeated_reference_is_cached(self) -> None:
+        """Test repeated lookups of the same reference hit the cache."""
+        validate_cell_reference("QZ42")
+        hits = _validate_cell_reference_cached.cache_info().hits
+
+        assert validate_cell_reference("QZ42") is True
+        assert _validate_cell_reference_cached.cache_info().hits == hits + 1
+
+    def test_column_letters_limited_to_three(self) -> None:
+        """Test column parts longer than Excel's three letters are rejected."""
+        assert validate_cell_reference("XFD1") is True
+        assert validate_cell_reference("AAAA1") is False
+
+    @pytest.mark.parametrize("ref", [None, 1, ["A1"], {"A1": 1}])
+    def test_non_string_input_returns_false(self, ref: object) -> None:
+        """Test non-string input, including unhashable values, is rejected."""
+        assert validate_cell_reference(ref) is False  # type: ignore[arg-type]
+
+    @pytest.mark.parametrize("ref", ["É1", "A١"])
+    def test_invalid_non_ascii_characters(self, ref: str) -> None:
+        """Test non-ASCII letters and digits are rejected."""
+        assert validate_cell_reference(ref) is False
+
+
+class TestReferencePatterns:
+    """Tests for the cell and range syntax patterns shared by the tools."""
+
+    @pytest.mark.parametrize("ref", ["A1", "b2", "XFD1048576"])
+    def test_cell_pattern_accepts(self, ref: str) -> None:
+        """Test well-formed single cells match."""
+        assert CELL_REFERENCE_RE.fullmatch(ref)
+
+    @pytest.mark.parametrize("ref", ["A0", "ABCD1", "A01", "A1:B2", "1A", "A1\n"])
+    def test_cell_pattern_rejects(self, ref: str) -> None:
+        """Test malformed cells and ranges do not match."""
+        assert not CELL_REFERENCE_RE.fullmatch(ref)
+
+    @pytest.mark.parametrize("ref", ["A1", "A1:B2", "c3:d4"])
+    def test_range_pattern_accepts(self, ref: str) -> None:
+        """Test single cells and two-cell ranges match."""
+        assert RANGE_REFERENCE_RE.fullmatch(ref)
+
+    @pytest.mark.parametrize("ref", ["A1:", "A1:B2:C3", "B0:C1", "A1:B2\n"])
+    def test_range_pattern_rejects(self, ref: str) -> None:
+        """Test malformed ranges do not match."""
+        assert not RANGE_REFERENCE_RE.fullmatch(ref)
@@ -0,0 +1,59 @@
+"""Tests for mcp_excel.core.chart module."""
+
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from openpyxl import Workbook, load_workbook
+
+from mcp_excel.core.chart import create_chart_in_sheet
+
+
+@pytest.fixture
+def sample_file(tmp_path: Path) -> str:
+    """Create a workbook with a small data table."""
+    wb = Workbook()
+    ws = wb.active
+    ws.title = "Sheet1"
+    for row in [["Month", "Sales"], ["Jan", 10], ["Feb", 20], ["Mar", 30]]:
+        ws.append(row)
+    path = tmp_path / "chart.xlsx"
+    wb.save(path)
+    wb.close()
+    return str(path)
+
+
+class TestCreateChartInSheet:
+    """Tests for create_chart_in_sheet function."""
+
+    def test_create_bar_chart(self, sample_file: str) -> None:
+        """Test a chart is added to the sheet and saved."""
+        result = create_chart_in_sheet(sample_file, "Sheet1", "A1:B4", "bar", "D2")
+
+        assert result["status"] == "success"
+        wb = load_workbook(sample_file)
+        assert len(wb["Sheet1"]._charts) == 1
+        wb.close()
+
+    @pytest.mark.parametrize(
+        ("data_range", "chart_type"),
+        [("A1:B4", "radar"), ("A1", "bar"), ("Sheet1!1A:B4", "bar")],
+    )
+    def test_invalid_request_skips_load(
+        self, sample_file: str, data_range: str, chart_type: str
+    ) -> None:
+        """Test invalid ranges and chart types fail before the workbook loads."""
+        with patch("mcp_excel.core.chart.load_workbook") as mock_load:
+            result = create_chart_in_sheet(
+                sample_file, "Sheet1", data_range, chart_type, "D2"
+            )
+
+        assert result["status"] == "error"
+        mock_load.assert_not_called()
+
+    def test_missing_sheet(self, sample_file: str) -> None:
+        """Test a missing target sheet is reported."""
+        result = create_chart_in_sheet(sample_file, "Missing", "A1:B4", "bar", "D2")
+
+        assert result["status"] == "error"
+        assert "Missing" in result["message"]
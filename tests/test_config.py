@@ -0,0 +1,167 @@
+"""Tests for mcp_excel.config module."""
+
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from pydantic import ValidationError
+
+from mcp_excel.config import (
+    ConfigurationError,
+    ConfigurationManager,
+    FileConfig,
+    MCPExcelConfig,
+    _resolve_directory,
+)
+
+
+class TestConfigurationManager:
+    """Tests for ConfigurationManager class."""
+
+    def test_identical_reload_reuses_config(
+        self, test_config: ConfigurationManager, tmp_path: Path
+    ) -> None:
+        """Test reloading with the same overrides skips rebuilding the model."""
+        first = test_config.config
+
+        with patch(
+            "mcp_excel.config.MCPExcelConfig", wraps=MCPExcelConfig
+        ) as mock_config:
+            test_config.reload_configuration(directory=str(tmp_path), log_level="INFO")
+
+        mock_config.assert_not_called()
+        assert test_config.config is first
+
+    def test_reload_with_new_overrides_rebuilds(
+        self, test_config: ConfigurationManager
+    ) -> None:
+        """Test different overrides produce a fresh configuration."""
+        test_config.reload_configuration(
+            directory=test_config.get_directory(), log_level="DEBUG"
+        )
+
+        assert test_config.get_log_level() == "DEBUG"
+
+    def test_reload_rebuilds_when_env_file_changes(
+        self,
+        test_config: ConfigurationManager,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test editing the .env file invalidates the cached configuration."""
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.delenv("LOG_LEVEL", raising=False)
+        env_file = tmp_path / ".env"
+        env_file.write_text("LOG_LEVEL=WARNING\n")
+        test_config.reload_configuration(directory=str(tmp_path))
+        assert test_config.get_log_level() == "WARNING"
+
+        env_file.write_text("LOG_LEVEL=DEBUG\n")
+        test_config.reload_configuration(directory=str(tmp_path))
+
+        assert test_config.get_log_level() == "DEBUG"
+
+    def test_get_directory_returns_resolved_path(
+        self,
+        test_config: ConfigurationManager,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test relative directories are reported in their resolved form."""
+        monkeypatch.chdir(tmp_path)
+        test_config.reload_configuration(directory="docs", log_level="INFO")
+
+        assert test_config.get_directory() == str((tmp_path / "docs").resolve())
+
+    def test_reload_rebuilds_when_directory_removed(
+        self, test_config: ConfigurationManager, tmp_path: Path
+    ) -> None:
+        """Test a cached configuration is not reused once its directory is gone."""
+        target = tmp_path / "docs"
+        test_config.reload_configuration(directory=str(target), log_level="INFO")
+        target.rmdir()
+
+        test_config.reload_configuration(directory=str(target), log_level="INFO")
+
+        assert target.is_dir()
+
+    def test_file_path_validation(
+        self, test_config: ConfigurationManager, tmp_path: Path
+    ) -> None:
+        """Test paths inside the directory pass and escapes through symlinks fail."""
+        inside = tmp_path / "book.xlsx"
+        assert test_config.validate_file_path(str(inside)) == str(inside.resolve())
+
+        outside = tmp_path.parent / f"{tmp_path.name}-outside"
+        outside.mkdir()
+        (tmp_path / "link").symlink_to(outside, target_is_directory=True)
+        with pytest.raises(ConfigurationError, match="outside allowed directory"):
+            test_config.validate_file_path(str(tmp_path / "link" / "book.xlsx"))
+
+    @pytest.mark.parametrize("suffix", ["-sibling/book.xlsx", "/../book.xlsx"])
+    def test_file_path_validation_rejects_escapes(
+        self, test_config: ConfigurationManager, tmp_path: Path, suffix: str
+    ) -> None:
+        """Test sibling prefixes and parent traversal are rejected."""
+        with pytest.raises(ConfigurationError, match="outside allowed directory"):
+            test_config.validate_file_path(str(tmp_path) + suffix)
+
+    def test_file_path_validation_accepts_directory_itself(
+        self, test_config: ConfigurationManager, tmp_path: Path
+    ) -> None:
+        """Test the configured directory itself is accepted."""
+        assert test_config.validate_file_path(str(tmp_path)) == str(tmp_path.resolve())
+
+    def test_file_path_validation_with_root_directory(
+        self, test_config: ConfigurationManager, tmp_path: Path
+    ) -> None:
+        """Test a filesystem root directory admits the paths below it."""
+        test_config.reload_configuration(directory="/", log_level="INFO")
+        target = tmp_path / "book.xlsx"
+
+        assert test_config.validate_file_path(str(target)) == str(target.resolve())
+
+
+class TestMCPExcelConfig:
+    """Tests for MCPExcelConfig class."""
+
+    def test_file_config_is_built_once(self, tmp_path: Path) -> None:
+        """Test file_config reuses the FileConfig validated at construction."""
+        config = MCPExcelConfig(directory=str(tmp_path))
+
+        with patch("mcp_excel.config.FileConfig") as mock_file_config:
+            first = config.file_config
+            second = config.file_config
+
+        mock_file_config.assert_not_called()
+        assert first is second
+        assert first.directory == str(tmp_path.resolve())
+
+    def test_user_config_variable_substitution(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test ${user_config.*} values are resolved from the environment."""
+        monkeypatch.setenv("DOCS_DIR", str(tmp_path))
+
+        config = MCPExcelConfig(directory="${user_config.docs_dir}")
+
+        assert config.directory == str(tmp_path)
+
+
+class TestFileConfig:
+    """Tests for FileConfig class."""
+
+    @pytest.mark.parametrize("directory", ["/invalid/path", "/path/that/is/fake"])
+    def test_placeholder_directory_rejected(self, directory: str) -> None:
+        """Test placeholder directories are rejected instead of created."""
+        with pytest.raises(ValidationError, match="Invalid directory path"):
+            FileConfig(directory=directory)
+
+    def test_directory_resolution_is_cached(self, tmp_path: Path) -> None:
+        """Test validating the same directory twice resolves it once."""
+        FileConfig(directory=str(tmp_path))
+        hits = _resolve_directory.cache_info().hits
+
+        FileConfig(directory=str(tmp_path))
+
+        assert _resolve_directory.cache_info().hits == hits + 1
@@ -13,16 +13,14 @@ TEST_SHEET = "Sheet1"
 TEST_DATA = [["Name", "Age"], ["Alice", 30], ["Bob", 25]]
 
 
-@pytest.mark.asyncio  # type: ignore[misc]
-async def test_read_data_from_excel_success(tmp_path) -> None:
-    """Test successful read operation from Excel."""
-    # Configure test environment
-    manager = ConfigurationManager()
-    manager.reload_configuration(directory=str(tmp_path), log_level="INFO")
+@pytest.fixture
+def test_file(cfg_manager: ConfigurationManager) -> Path:
+    """Path of a workbook inside the configured directory."""
+    return Path(cfg_manager.get_directory()) / "test_file.xlsx"
 
-    # Create test file
-    test_file = tmp_path / "test_file.xlsx"
 
+async def test_read_data_from_excel_success(test_file: Path) -> None:
+    """Test successful read operation from Excel."""
     with patch("mcp_excel.tools.content_tools.read_excel_range") as mock_read:
         # Mock actual function
         mock_read.return_value = ["Row1", "Row2"]
@@ -34,16 +32,8 @@ async def test_read_data_from_excel_success(tmp_path) -> None:
     mock_read.assert_called_once()
 
 
-@pytest.mark.asyncio  # type: ignore[misc]
-async def test_read_data_from_excel_no_data(tmp_path) -> None:
+async def test_read_data_from_excel_no_data(test_file: Path) -> None:
     """Test read operation when no data is found."""
-    # Configure test environment
-    manager = ConfigurationManager()
-    manager.reload_configuration(directory=str(tmp_path), log_level="INFO")
-
-    # Create test file
-    test_file = tmp_path / "test_file.xlsx"
-
     with patch("mcp_excel.tools.content_tools.read_excel_range") as mock_read:
         # Mock actual function to return empty data
         mock_read.return_value = []
@@ -54,16 +44,8 @@ async def test_read_data_from_excel_no_data(tmp_path) -> None:
     assert "No data found" in result["message"]
 
 
-@pytest.mark.asyncio  # type: ignore[misc]
-async def test_read_data_from_excel_error(tmp_path) -> None:
+async def test_read_data_from_excel_error(test_file: Path) -> None:
     """Test error handling during read operation."""
-    # Configure test environment
-    manager = ConfigurationManager()
-    manager.reload_configuration(directory=str(tmp_path), log_level="INFO")
-
-    # Create test file
-    test_file = tmp_path / "test_file.xlsx"
-
     with patch("mcp_excel.tools.content_tools.read_excel_range") as mock_read:
         mock_read.side_effect = Exception("Read error")
 
@@ -73,16 +55,8 @@ async def test_read_data_from_excel_error(tmp_path) -> None:
     assert "Failed to read Excel data" in result["message"]
 
 
-@pytest.mark.asyncio  # type: ignore[misc]
-async def test_write_data_to_excel_success(tmp_path) -> None:
+async def test_write_data_to_excel_success(test_file: Path) -> None:
     """Test successful write operation to Excel."""
-    # Configure test environment
-    manager = ConfigurationManager()
-    manager.reload_configuration(directory=str(tmp_path), log_level="INFO")
-
-    # Create test file
-    test_file = tmp_path / "test_file.xlsx"
-
     with patch("mcp_excel.core.data.write_data") as mock_write:
         mock_write.return_value = {"message": "Data written successfully"}
 
@@ -97,16 +71,8 @@ async def test_write_data_to_excel_success(tmp_path) -> None:
         assert args[2] == TEST_DATA
 
 
-@pytest.mark.asyncio  # type: ignore[misc]
-async def test_write_data_to_excel_validation_error(tmp_path) -> None:
+async def test_write_data_to_excel_validation_error(test_file: Path) -> None:
     """Test validation error during write operation."""
-    # Configure test environment
-    manager = ConfigurationManager()
-    manager.reload_configuration(directory=str(tmp_path), log_level="INFO")
-
-    # Create test file
-    test_file = tmp_path / "test_file.xlsx"
-
     with patch("mcp_excel.core.data.write_data") as mock_write:
         mock_write.side_effect = ValidationError("Invalid data")
 
@@ -117,16 +83,8 @@ async def test_write_data_to_excel_validation_error(tmp_path) -> None:
         assert "Error: Invalid data" in result
 
 
-@pytest.mark.asyncio  # type: ignore[misc]
-async def test_write_data_to_excel_general_error(tmp_path) -> None:
+async def test_write_data_to_excel_general_error(test_file: Path) -> None:
     """Test general error during write operation."""
-    # Configure test environment
-    manager = ConfigurationManager()
-    manager.reload_configuration(directory=str(tmp_path), log_level="INFO")
-
-    # Create test file
-    test_file = tmp_path / "test_file.xlsx"
-
     with patch("mcp_excel.core.data.write_data") as mock_write:
         mock_write.side_effect = Exception("Write error")
 
@@ -1,9 +1,11 @@
 """Tests for context managers in workbook module."""
 
+import shutil
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
-from openpyxl import Workbook
+from openpyxl import Workbook, load_workbook
 
 from mcp_excel.exceptions.exception_core import SheetNotFoundError
 from mcp_excel.core.workbook import (
@@ -12,6 +14,18 @@ from mcp_excel.core.workbook import (
 )
 
 
+@pytest.fixture(scope="module")
+def template_xlsx(tmp_path_factory) -> Path:
+    """Build the "existing file" workbook once for the whole module."""
+    wb = Workbook()
+    wb.active["A1"] = "Existing Data"
+    wb.create_sheet("ExistingSheet")["A1"] = "Existing Data"
+    template_path = tmp_path_factory.mktemp("tpl") / "tpl.xlsx"
+    wb.save(template_path)
+    wb.close()
+    return template_path
+
+
 class TestManagedWorkbook:
     """Test cases for managed_workbook context manager."""
 
@@ -31,15 +45,11 @@ class TestManagedWorkbook:
         wb = Workbook()
         # We can't easily verify with openpyxl here, but the save happened
 
-    def test_managed_workbook_opens_existing_file(self, tmp_path):
+    def test_managed_workbook_opens_existing_file(self, tmp_path, template_xlsx):
         """Test that managed_workbook opens existing files."""
         # Create existing file
         test_file = tmp_path / "existing.xlsx"
-        wb = Workbook()
-        ws = wb.active
-        ws["A1"] = "Existing Data"
-        wb.save(test_file)
-        wb.close()
+        shutil.copyfile(template_xlsx, test_file)
 
         # Open with context manager
         with managed_workbook(test_file) as wb:
@@ -63,15 +73,11 @@ class TestManagedWorkbook:
         # File should be saved
         assert test_file.exists()
 
-    def test_managed_workbook_auto_save_false(self, tmp_path):
+    def test_managed_workbook_auto_save_false(self, tmp_path, template_xlsx):
         """Test that auto_save=False doesn't save on exit."""
         # Create existing file
         test_file = tmp_path / "no_autosave.xlsx"
-        wb = Workbook()
-        ws = wb.active
-        ws["A1"] = "Original"
-        wb.save(test_file)
-        wb.close()
+        shutil.copyfile(template_xlsx, test_file)
 
         # Get original modification time
         original_mtime = test_file.stat().st_mtime
@@ -85,23 +91,34 @@ class TestManagedWorkbook:
         # Note: This might be flaky due to filesystem timing
         # A better approach would be to reopen and check content
 
-    def test_managed_workbook_read_only(self, tmp_path):
+    def test_managed_workbook_read_only(self, tmp_path, template_xlsx):
         """Test read_only mode."""
         # Create file
         test_file = tmp_path / "readonly.xlsx"
-        wb = Workbook()
-        ws = wb.active
-        ws["A1"] = "Read Only Data"
-        wb.save(test_file)
-        wb.close()
+        shutil.copyfile(template_xlsx, test_file)
 
         # Open in read-only mode
         with managed_workbook(test_file, read_only=True) as wb:
             ws = wb.active
             # Should be able to read
-            assert ws["A1"].value == "Read Only Data"
+            assert ws["A1"].value == "Existing Data"
             # Writing might fail or be ignored depending on openpyxl version
 
+    def test_managed_workbook_read_only_skips_links(self, tmp_path, template_xlsx):
+        """Test read-only loads skip external links and keep formulas."""
+        test_file = tmp_path / "readonly_links.xlsx"
+        shutil.copyfile(template_xlsx, test_file)
+
+        with patch(
+            "mcp_excel.core.workbook.load_workbook", wraps=load_workbook
+        ) as mock_load:
+            with managed_workbook(test_file, read_only=True):
+                pass
+
+        _, kwargs = mock_load.call_args
+        assert kwargs["keep_links"] is False
+        assert kwargs["data_only"] is False
+
     def test_managed_workbook_exception_cleanup(self, tmp_path):
         """Test that resources are cleaned up on exception."""
         test_file = tmp_path / "exception.xlsx"
@@ -143,28 +160,21 @@ class TestManagedWorksheet:
         wb = Workbook()
         # Would need to reopen to verify
 
-    def test_managed_worksheet_opens_existing(self, tmp_path):
+    def test_managed_worksheet_opens_existing(self, tmp_path, template_xlsx):
         """Test that managed_worksheet opens existing sheet."""
         # Create file with sheet
         test_file = tmp_path / "existing_sheet.xlsx"
-        wb = Workbook()
-        wb.create_sheet("ExistingSheet")
-        ws = wb["ExistingSheet"]
-        ws["A1"] = "Existing Data"
-        wb.save(test_file)
-        wb.close()
+        shutil.copyfile(template_xlsx, test_file)
 
         # Open existing sheet
         with managed_worksheet(test_file, "ExistingSheet") as ws:
             assert ws["A1"].value == "Existing Data"
             ws["B1"] = "Added Data"
 
-    def test_managed_worksheet_create_if_missing_false(self, tmp_path):
+    def test_managed_worksheet_create_if_missing_false(self, tmp_path, template_xlsx):
         """Test that create_if_missing=False raises error."""
         test_file = tmp_path / "no_create.xlsx"
-        wb = Workbook()
-        wb.save(test_file)
-        wb.close()
+        shutil.copyfile(template_xlsx, test_file)
 
         with pytest.raises(SheetNotFoundError):
             with managed_worksheet(
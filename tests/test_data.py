@@ -1,9 +1,10 @@
 """Tests for mcp_excel.core.data module."""
 
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
-from openpyxl import Workbook
+from openpyxl import Workbook, load_workbook
 
 from mcp_excel.core.data import (
     _get_used_range,
@@ -78,6 +79,15 @@ class TestParseCellReference:
         with pytest.raises(InvalidCellReferenceError):
             _parse_cell_reference("")
 
+    def test_single_cell_parsed_directly(self) -> None:
+        """Test the reference is parsed as one cell, not as a self-range."""
+        with patch(
+            "mcp_excel.core.data.parse_cell_range", return_value=(3, 4, None, None)
+        ) as mock_parse:
+            assert _parse_cell_reference("D3") == (3, 4)
+
+        mock_parse.assert_called_once_with("D3")
+
 
 class TestGetUsedRange:
     """Tests for _get_used_range function."""
@@ -182,6 +192,38 @@ class TestReadExcelRange:
 
         assert len(result) >= 1
 
+    def test_read_uses_read_only_mode(self, tmp_path: Path) -> None:
+        """Test the workbook is opened read-only without external links."""
+        test_file = tmp_path / "test.xlsx"
+        wb = Workbook()
+        wb.active.title = "Sheet1"
+        wb.active["A1"] = "Data"
+        wb.save(test_file)
+        wb.close()
+
+        with patch(
+            "mcp_excel.core.data.load_workbook", wraps=load_workbook
+        ) as mock_load:
+            result = read_excel_range(test_file, "Sheet1", "A1")
+
+        assert result == [["Data"]]
+        _, kwargs = mock_load.call_args
+        assert kwargs["read_only"] is True
+        assert kwargs["keep_links"] is False
+
+    def test_read_empty_detected_range(self, tmp_path: Path) -> None:
+        """Test an empty start cell yields no rows rather than the whole sheet."""
+        test_file = tmp_path / "test.xlsx"
+        wb = Workbook()
+        ws = wb.active
+        ws.title = "Sheet1"
+        ws["A1"] = "Data"
+        ws["C3"] = "Below"
+        wb.save(test_file)
+        wb.close()
+
+        assert read_excel_range(test_file, "Sheet1", "C1") == []
+
     def test_read_out_of_bounds_range(self, tmp_path: Path) -> None:
         """Test reading out of bounds range raises error."""
         test_file = tmp_path / "test.xlsx"
@@ -250,6 +292,23 @@ class TestWriteDataToWorksheet:
         assert ws["B1"].value == "New"
         wb.close()
 
+    def test_write_data_to_new_sheet_appends_rows(self, tmp_path: Path) -> None:
+        """Test a new sheet is filled by appending rows at the offset."""
+        wb = Workbook()
+        ws = wb.create_sheet("Fresh")
+
+        test_data = [["Name", None, "City"], ["Alice", 30, None]]
+
+        _write_data_to_worksheet(ws, test_data, 3, 2, new_sheet=True)
+
+        assert ws["B3"].value == "Name"
+        assert ws["D3"].value == "City"
+        assert ws["B4"].value == "Alice"
+        assert ws["C4"].value == 30
+        # None values and the skipped offset never become cells
+        assert sorted(ws._cells) == [(3, 2), (3, 4), (4, 2), (4, 3)]
+        wb.close()
+
 
 class TestWriteData:
     """Tests for write_data function."""
@@ -298,6 +357,28 @@ class TestWriteData:
         assert result["status"] == "success"
         assert "NewSheet" in result["active_sheet"]
 
+    def test_write_data_create_new_sheet_with_offset(self, tmp_path: Path) -> None:
+        """Test a new sheet is filled from a start cell past A1."""
+        test_file = tmp_path / "test.xlsx"
+        wb = Workbook()
+        wb.active.title = "Sheet1"
+        wb.save(test_file)
+        wb.close()
+
+        test_data = [["Name", "Age"], ["Alice", 30]]
+
+        result = write_data(test_file, "NewSheet", test_data, "B2")
+
+        assert result["status"] == "success"
+        wb = load_workbook(test_file)
+        ws = wb["NewSheet"]
+        assert ws["B2"].value == "Name"
+        assert ws["C2"].value == "Age"
+        assert ws["B3"].value == "Alice"
+        assert ws["C3"].value == 30
+        assert ws["A1"].value is None
+        wb.close()
+
     def test_write_data_no_data_raises_error(self, tmp_path: Path) -> None:
         """Test that writing empty data raises error."""
         test_file = tmp_path / "test.xlsx"
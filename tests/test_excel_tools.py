@@ -1,8 +1,6 @@
 from pathlib import Path
 from unittest.mock import patch
 
-import pytest
-
 from mcp_excel.exceptions.exception_tools import ValidationError, WorkbookError
 from mcp_excel.tools import excel_tools
 from mcp_excel.config import ConfigurationManager
@@ -11,7 +9,6 @@ from mcp_excel.config import ConfigurationManager
 TEST_SHEET = "TestSheet"
 
 
-@pytest.mark.asyncio  # type: ignore[misc]
 async def test_create_excel_workbook_success(tmp_path) -> None:
     """Test successful workbook creation."""
     # Configure test environment
@@ -29,7 +26,6 @@ async def test_create_excel_workbook_success(tmp_path) -> None:
         mock_create.assert_called_once()
 
 
-@pytest.mark.asyncio  # type: ignore[misc]
 async def test_create_excel_workbook_workbook_error(tmp_path) -> None:
     """Test workbook creation with WorkbookError."""
     # Configure test environment
@@ -46,7 +42,6 @@ async def test_create_excel_workbook_workbook_error(tmp_path) -> None:
         assert "error" in result
 
 
-@pytest.mark.asyncio  # type: ignore[misc]
 async def test_create_excel_worksheet_success(tmp_path) -> None:
     """Test successful worksheet creation."""
     # Configure test environment
@@ -70,7 +65,6 @@ async def test_create_excel_worksheet_success(tmp_path) -> None:
         mock_create_sheet.assert_called_once_with(test_file, TEST_SHEET)
 
 
-@pytest.mark.asyncio  # type: ignore[misc]
 async def test_create_excel_worksheet_validation_error(tmp_path) -> None:
     """Test worksheet creation with ValidationError."""
     # Configure test environment
@@ -91,7 +85,6 @@ async def test_create_excel_worksheet_validation_error(tmp_path) -> None:
         assert "Invalid sheet name" in result["message"]
 
 
-@pytest.mark.asyncio  # type: ignore[misc]
 async def test_list_excel_documents_success() -> None:
     """Test successful listing of Excel documents."""
     test_files = [
@@ -111,7 +104,6 @@ async def test_list_excel_documents_success() -> None:
         assert len(result["files"]) == 2
 
 
-@pytest.mark.asyncio  # type: ignore[misc]
 async def test_list_excel_documents_error() -> None:
     """Test error handling when listing documents."""
     with patch(
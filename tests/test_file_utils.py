@@ -1,5 +1,6 @@
 """Tests for mcp_excel.utils.file_utils module."""
 
+import inspect
 import os
 from pathlib import Path
 from unittest.mock import patch
@@ -15,6 +16,7 @@ from mcp_excel.utils.file_utils import (
     ensure_xlsx_extension,
     list_excel_files_in_directory,
     resolve_safe_path,
+    resolve_xlsx,
     validate_file_access,
 )
 
@@ -43,6 +45,26 @@ class TestGetAllowedDirectories:
 
         assert str(tmp_path.resolve()) in [str(Path(d).resolve()) for d in result]
 
+    def test_get_allowed_directories_follows_config_change(
+        self, tmp_path: Path
+    ) -> None:
+        """Test the cached result is reused until the configured value changes."""
+        first_dir = tmp_path / "first"
+        second_dir = tmp_path / "second"
+
+        with patch(
+            "mcp_excel.utils.file_utils.get_directory", return_value=str(first_dir)
+        ):
+            first = _get_allowed_directories()
+            assert _get_allowed_directories() is first
+        with patch(
+            "mcp_excel.utils.file_utils.get_directory", return_value=str(second_dir)
+        ):
+            second = _get_allowed_directories()
+
+        assert first == (str(first_dir.resolve()),)
+        assert second == (str(second_dir.resolve()),)
+
 
 class TestIsPathInAllowedDirectories:
     """Tests for _is_path_in_allowed_directories function."""
@@ -75,6 +97,42 @@ class TestIsPathInAllowedDirectories:
         assert error is not None
         assert "not in allowed directories" in error
 
+    def test_sibling_with_same_prefix_is_rejected(self, tmp_path: Path) -> None:
+        """Test a directory sharing the allowed name as a prefix is not allowed."""
+        allowed_path = tmp_path / "docs"
+
+        with patch(
+            "mcp_excel.utils.file_utils._get_allowed_directories",
+            return_value=[str(allowed_path)],
+        ):
+            sibling, _ = _is_path_in_allowed_directories(
+                str(tmp_path / "docs2" / "test.xlsx")
+            )
+            itself, _ = _is_path_in_allowed_directories(str(allowed_path))
+
+        assert sibling is False
+        assert itself is True
+
+    def test_many_and_nested_allowed_directories(self, tmp_path: Path) -> None:
+        """Test lookups across several, partly nested allowed directories."""
+        allowed = [str(tmp_path / name) for name in ("m", "a", "a/b", "z", "a-b")]
+
+        with patch(
+            "mcp_excel.utils.file_utils._get_allowed_directories",
+            return_value=allowed,
+        ):
+            results = {
+                name: _is_path_in_allowed_directories(str(tmp_path / name))[0]
+                for name in ("a/c/x.xlsx", "a/b/x.xlsx", "a-b/x.xlsx", "n/x.xlsx")
+            }
+
+        assert results == {
+            "a/c/x.xlsx": True,
+            "a/b/x.xlsx": True,
+            "a-b/x.xlsx": True,
+            "n/x.xlsx": False,
+        }
+
     def test_path_with_symlink(self, tmp_path: Path) -> None:
         """Test path resolution with symlinks."""
         real_dir = tmp_path / "real"
@@ -126,6 +184,23 @@ class TestCheckFileWriteable:
 
         assert is_writable is True
 
+    def test_check_writeable_does_not_open_file(self, tmp_path: Path) -> None:
+        """Test the check relies on permissions and never opens the file."""
+        test_file = tmp_path / "existing.xlsx"
+        test_file.write_text("test")
+
+        with (
+            patch(
+                "mcp_excel.utils.file_utils._get_allowed_directories",
+                return_value=[str(tmp_path)],
+            ),
+            patch("builtins.open") as mock_open,
+        ):
+            is_writable, _ = _check_file_writeable(str(test_file))
+
+        assert is_writable is True
+        mock_open.assert_not_called()
+
     def test_check_writeable_directory_not_writeable(self, tmp_path: Path) -> None:
         """Test checking write permission when directory is not writeable."""
         test_file = tmp_path / "subdir" / "test.xlsx"
@@ -232,6 +307,19 @@ class TestCreateDocumentCopy:
         assert new_path == str(dest)
         assert dest.exists()
 
+    def test_create_copy_keeps_content_and_mode(self, tmp_path: Path) -> None:
+        """Test the copy has the source's content and permission bits."""
+        source = tmp_path / "source.xlsx"
+        dest = tmp_path / "destination.xlsx"
+        source.write_text("test content")
+        source.chmod(0o640)
+
+        success, _, _ = create_document_copy(str(source), str(dest))
+
+        assert success is True
+        assert dest.read_text() == "test content"
+        assert dest.stat().st_mode & 0o777 == source.stat().st_mode & 0o777
+
     def test_create_copy_source_not_found(self, tmp_path: Path) -> None:
         """Test copy when source doesn't exist."""
         source = tmp_path / "nonexistent.xlsx"
@@ -261,6 +349,41 @@ class TestEnsureXlsxExtension:
         result = ensure_xlsx_extension("test.docx")
         assert result == "test.docx.xlsx"
 
+    def test_filename_with_uppercase_extension(self) -> None:
+        """Test the extension is recognised regardless of case."""
+        assert ensure_xlsx_extension("test.XLSX") == "test.XLSX"
+        assert ensure_xlsx_extension("test.Xlsx") == "test.Xlsx"
+
+    def test_repeated_filename_is_cached(self) -> None:
+        """Test repeated lookups of the same filename hit the cache."""
+        ensure_xlsx_extension("cached_report")
+        hits = ensure_xlsx_extension.cache_info().hits
+
+        assert ensure_xlsx_extension("cached_report") == "cached_report.xlsx"
+        assert ensure_xlsx_extension.cache_info().hits == hits + 1
+
+
+class TestResolveXlsx:
+    """Tests for resolve_xlsx function."""
+
+    def test_existing_file(self, tmp_path: Path) -> None:
+        """Test an existing file is resolved with its stat result."""
+        test_file = tmp_path / "test.xlsx"
+        test_file.write_bytes(b"data")
+
+        path, file_stat = resolve_xlsx(str(tmp_path / "test"))
+
+        assert path == test_file.resolve()
+        assert file_stat is not None
+        assert file_stat.st_size == 4
+
+    def test_missing_file(self, tmp_path: Path) -> None:
+        """Test a missing file returns no stat result."""
+        path, file_stat = resolve_xlsx(tmp_path / "missing.xlsx")
+
+        assert path == (tmp_path / "missing.xlsx").resolve()
+        assert file_stat is None
+
 
 class TestListExcelFilesInDirectory:
     """Tests for list_excel_files_in_directory function."""
@@ -308,6 +431,23 @@ class TestListExcelFilesInDirectory:
 
         assert result == []
 
+    def test_list_excel_files_skips_symlinks(self, tmp_path: Path) -> None:
+        """Test symlinked entries are not listed."""
+        outside = tmp_path / "outside.xlsx"
+        outside.write_text("x")
+        docs = tmp_path / "docs"
+        docs.mkdir()
+        (docs / "real.xlsx").write_text("x")
+        try:
+            (docs / "link.xlsx").symlink_to(outside)
+        except (OSError, NotImplementedError):
+            pytest.skip("Symlinks not supported on this platform")
+
+        with patch("mcp_excel.utils.file_utils.get_directory", return_value=str(docs)):
+            result = list_excel_files_in_directory()
+
+        assert [f["filename"] for f in result] == ["real.xlsx"]
+
     def test_list_excel_files_directory_not_found(self, tmp_path: Path) -> None:
         """Test listing when directory doesn't exist."""
         nonexistent = tmp_path / "nonexistent"
@@ -368,6 +508,64 @@ class TestValidateFileAccess:
 
         assert result["status"] == "success"
 
+    def test_validate_does_not_create_missing_file(self, tmp_path: Path) -> None:
+        """Test validating a new file does not leave an empty file behind."""
+        test_file = tmp_path / "new.xlsx"
+
+        @validate_file_access("filename")
+        def test_func(filename: str) -> dict:
+            return {"status": "success"}
+
+        with patch(
+            "mcp_excel.utils.file_utils._get_allowed_directories",
+            return_value=[str(tmp_path)],
+        ):
+            result = test_func(str(tmp_path / "new"))
+
+        assert result["status"] == "success"
+        assert not test_file.exists()
+
+    def test_validate_passes_normalized_filename(self, tmp_path: Path) -> None:
+        """Test the wrapped function receives the name with .xlsx added."""
+
+        @validate_file_access("filename")
+        def test_func(sheet_name: str, filename: str) -> dict:
+            return {"status": "success", "filename": filename}
+
+        with patch(
+            "mcp_excel.utils.file_utils._get_allowed_directories",
+            return_value=[str(tmp_path)],
+        ):
+            positional = test_func("Sheet1", str(tmp_path / "report"))
+            keyword = test_func("Sheet1", filename=str(tmp_path / "report"))
+
+        assert positional["filename"] == str(tmp_path / "report.xlsx")
+        assert keyword["filename"] == str(tmp_path / "report.xlsx")
+
+    def test_validate_uses_default_and_inspects_once(self, tmp_path: Path) -> None:
+        """Test defaults are honoured and the signature is read at decoration."""
+        default = str(tmp_path / "default")
+
+        with patch(
+            "mcp_excel.utils.file_utils.inspect.signature",
+            wraps=inspect.signature,
+        ) as mock_signature:
+
+            @validate_file_access("filename")
+            def test_func(filename: str = default) -> dict:
+                return {"status": "success", "filename": filename}
+
+            with patch(
+                "mcp_excel.utils.file_utils._get_allowed_directories",
+                return_value=[str(tmp_path)],
+            ):
+                first = test_func()
+                second = test_func(str(tmp_path / "other"))
+
+        assert first["filename"] == default + ".xlsx"
+        assert second["filename"] == str(tmp_path / "other.xlsx")
+        mock_signature.assert_called_once()
+
     def test_validate_access_denied(self, tmp_path: Path) -> None:
         """Test decorator when access is denied."""
         allowed_dir = tmp_path / "allowed"
@@ -8,9 +8,7 @@ from mcp_excel.tools import format_tools
 
 
 # Test data
-TEST_DIR = Path(__file__).parent.parent / "documents"
-TEST_DIR.mkdir(exist_ok=True)
-TEST_FILENAME = str(TEST_DIR / "test_workbook.xlsx")
+TEST_FILENAME = "test_workbook.xlsx"
 TEST_SHEET = "Sheet1"
 TEST_NEW_SHEET = "NewSheet"
 TEST_RANGE_START = "A1"
@@ -18,7 +16,6 @@ TEST_RANGE_END = "B2"
 
 
 # Test for format_range
-@pytest.mark.asyncio  # type: ignore[misc]
 async def test_format_range_success() -> None:
     """Test successful cell formatting."""
     with patch("mcp_excel.tools.format_tools.format_range_excel") as mock_format:
@@ -37,7 +34,6 @@ async def test_format_range_success() -> None:
         mock_format.assert_called_once()
 
 
-@pytest.mark.asyncio  # type: ignore[misc]
 async def test_format_range_validation_error() -> None:
     """Test formatting with invalid input."""
     with patch("mcp_excel.tools.format_tools.format_range") as mock_format:
@@ -56,7 +52,6 @@ async def test_format_range_validation_error() -> None:
 
 
 # Test for copy_worksheet
-@pytest.mark.asyncio  # type: ignore[misc]
 async def test_copy_worksheet_success() -> None:
     """Test successful worksheet copy."""
     with patch("mcp_excel.tools.format_tools.copy_sheet") as mock_copy:
@@ -72,7 +67,6 @@ async def test_copy_worksheet_success() -> None:
 
 
 # Test for delete_worksheet
-@pytest.mark.asyncio  # type: ignore[misc]
 async def test_delete_worksheet_success() -> None:
     """Test successful worksheet deletion."""
     with patch("mcp_excel.tools.format_tools.delete_sheet") as mock_delete:
@@ -85,7 +79,6 @@ async def test_delete_worksheet_success() -> None:
 
 
 # Test for rename_worksheet
-@pytest.mark.asyncio  # type: ignore[misc]
 async def test_rename_worksheet_success() -> None:
     """Test successful worksheet renaming."""
     with patch("mcp_excel.tools.format_tools.rename_sheet") as mock_rename:
@@ -105,7 +98,6 @@ async def test_rename_worksheet_success() -> None:
 
 
 # Test for get_workbook_metadata
-@pytest.mark.asyncio  # type: ignore[misc]
 async def test_get_workbook_metadata_success() -> None:
     """Test successful retrieval of workbook metadata."""
     test_metadata = {
@@ -124,7 +116,6 @@ async def test_get_workbook_metadata_success() -> None:
 
 
 # Test for merge_cells
-@pytest.mark.asyncio  # type: ignore[misc]
 async def test_merge_cells_success() -> None:
     """Test successful cell merging."""
     with patch("mcp_excel.tools.format_tools.merge_range") as mock_merge:
@@ -142,7 +133,6 @@ async def test_merge_cells_success() -> None:
 
 
 # Test for unmerge_cells
-@pytest.mark.asyncio  # type: ignore[misc]
 async def test_unmerge_cells_success() -> None:
     """Test successful cell unmerging."""
     with patch("mcp_excel.tools.format_tools.unmerge_range") as mock_unmerge:
@@ -160,7 +150,6 @@ async def test_unmerge_cells_success() -> None:
 
 
 # Test for copy_range
-@pytest.mark.asyncio  # type: ignore[misc]
 async def test_copy_range_success() -> None:
     """Test successful range copying."""
     with patch("mcp_excel.tools.format_tools.copy_range") as mock_copy_range:
@@ -184,7 +173,6 @@ async def test_copy_range_success() -> None:
 
 
 # Test for delete_range
-@pytest.mark.asyncio  # type: ignore[misc]
 async def test_delete_range_success() -> None:
     """Test successful range deletion."""
     with patch("mcp_excel.tools.format_tools.delete_range_operation") as mock_delete:
@@ -202,7 +190,6 @@ async def test_delete_range_success() -> None:
 
 
 # Test for validate_excel_range
-@pytest.mark.asyncio  # type: ignore[misc]
 async def test_validate_excel_range_success() -> None:
     """Test successful range validation."""
     with patch("mcp_excel.tools.format_tools.validate_excel_range") as mock_validate:
@@ -218,3 +205,81 @@ async def test_validate_excel_range_success() -> None:
 
         assert result["is_valid"] is True
         assert "dimensions" in result
+
+
+@pytest.mark.parametrize("end_cell", ["B0", "ABCD2", "B2:C3"])
+async def test_validate_excel_range_rejects_malformed_range(end_cell: str) -> None:
+    """Test a malformed range is rejected before the workbook is opened."""
+    with patch(
+        "mcp_excel.utils.validation_utils.validate_range_in_sheet_operation"
+    ) as mock_validate:
+        result = await format_tools.validate_excel_range(
+            TEST_FILENAME, TEST_SHEET, TEST_RANGE_START, end_cell
+        )
+
+    assert result["status"] == "error"
+    assert "Invalid range syntax" in result["message"]
+    mock_validate.assert_not_called()
+
+
+async def test_validate_excel_range_two_cells(tmp_path: Path) -> None:
+    """Test a start/end cell pair is validated against the sheet."""
+    from openpyxl import Workbook
+
+    test_file = str(tmp_path / "range.xlsx")
+    wb = Workbook()
+    ws = wb.active
+    ws.title = TEST_SHEET
+    ws["C3"] = 1
+    wb.save(test_file)
+
+    result = await format_tools.validate_excel_range(
+        test_file, TEST_SHEET, TEST_RANGE_START, TEST_RANGE_END
+    )
+
+    assert result["status"] == "success"
+    assert result["range"] == f"{TEST_RANGE_START}:{TEST_RANGE_END}"
+    assert result["data_dimensions"]["max_row"] == 3
+    assert result["data_dimensions"]["max_col"] == 3
+
+
+async def test_validate_excel_range_missing_file(tmp_path: Path) -> None:
+    """Test a missing workbook reports the load error itself."""
+    result = await format_tools.validate_excel_range(
+        str(tmp_path / "missing.xlsx"), TEST_SHEET, TEST_RANGE_START, TEST_RANGE_END
+    )
+
+    assert result["status"] == "error"
+    assert "No such file" in result["message"]
+
+
+async def test_validate_excel_range_without_dimension_record(tmp_path: Path) -> None:
+    """Test a sheet without a <dimension> record is measured from its rows."""
+    import re
+    import zipfile
+
+    from openpyxl import Workbook
+
+    source = tmp_path / "source.xlsx"
+    wb = Workbook()
+    ws = wb.active
+    ws.title = TEST_SHEET
+    ws["C3"] = 1
+    wb.save(source)
+
+    # Rewrite the archive with the sheet's <dimension> element stripped
+    test_file = tmp_path / "no_dimension.xlsx"
+    with zipfile.ZipFile(source) as src, zipfile.ZipFile(test_file, "w") as dst:
+        for item in src.infolist():
+            data = src.read(item)
+            if item.filename == "xl/worksheets/sheet1.xml":
+                data = re.sub(rb"<dimension [^>]*/>", b"", data)
+            dst.writestr(item, data)
+
+    result = await format_tools.validate_excel_range(
+        str(test_file), TEST_SHEET, TEST_RANGE_START, TEST_RANGE_END
+    )
+
+    assert result["status"] == "success"
+    assert result["data_dimensions"]["max_row"] == 3
+    assert result["data_dimensions"]["max_col"] == 3
@@ -0,0 +1,66 @@
+"""Tests for mcp_excel.core.formatting module."""
+
+from pathlib import Path
+
+import pytest
+from openpyxl import Workbook, load_workbook
+
+from mcp_excel.core.formatting import format_range
+
+
+@pytest.fixture
+def sample_file(tmp_path: Path) -> str:
+    """Create an empty workbook to format."""
+    wb = Workbook()
+    wb.active.title = "Sheet1"
+    path = tmp_path / "format.xlsx"
+    wb.save(path)
+    wb.close()
+    return str(path)
+
+
+class TestFormatRange:
+    """Tests for format_range function."""
+
+    @pytest.mark.parametrize("end_cell", [None, "B2"])
+    def test_single_cell(self, sample_file: str, end_cell: str | None) -> None:
+        """Test formatting a single cell touches only that cell."""
+        result = format_range(
+            sample_file,
+            "Sheet1",
+            "B2",
+            end_cell,
+            bold=True,
+            bg_color="00FF00",
+            border_style="thin",
+            number_format="0.00",
+        )
+
+        assert result["status"] == "success"
+        wb = load_workbook(sample_file)
+        ws = wb["Sheet1"]
+        assert ws["B2"].font.bold
+        assert ws["B2"].fill.start_color.rgb == "FF00FF00"
+        assert ws["B2"].border.left.style == "thin"
+        assert ws["B2"].number_format == "0.00"
+        assert not ws["A1"].font.bold
+        assert not ws["C2"].font.bold
+        wb.close()
+
+    def test_range(self, sample_file: str) -> None:
+        """Test formatting every cell of a range."""
+        result = format_range(sample_file, "Sheet1", "A1", "B3", italic=True)
+
+        assert result["status"] == "success"
+        assert result["range"] == "A1:B3"
+        wb = load_workbook(sample_file)
+        ws = wb["Sheet1"]
+        assert all(cell.font.italic for row in ws["A1:B3"] for cell in row)
+        assert not ws["C1"].font.italic
+        wb.close()
+
+    def test_invalid_single_cell(self, sample_file: str) -> None:
+        """Test an out-of-bounds single cell returns an error."""
+        result = format_range(sample_file, "Sheet1", "A0", bold=True)
+
+        assert result["status"] == "error"
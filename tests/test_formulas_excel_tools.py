@@ -1,5 +1,5 @@
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import ANY, patch
 
 import pytest
 
@@ -8,7 +8,10 @@ from openpyxl import Workbook
 from mcp_excel.exceptions.exception_tools import ValidationError
 from mcp_excel.tools import formulas_excel_tools
 from mcp_excel.config import ConfigurationManager
-from mcp_excel.utils.validation_utils import validate_formula_in_cell_operation
+from mcp_excel.utils.validation_utils import (
+    validate_formula,
+    validate_formula_in_cell_operation,
+)
 
 
 # Test data
@@ -91,8 +94,67 @@ def test_validate_formula_in_cell_operation_sheet_not_found(tmp_path: Path) -> N
     assert "Sheet 'NonExistentSheet' not found" in result["message"]
 
 
+@pytest.mark.parametrize(
+    "formula", ['=CONCAT("WEBSERVICE(ZZZZ1)", B1)', '=CONCAT("(", B1, ")))")']
+)
+def test_validate_formula_in_cell_operation_ignores_string_literals(
+    tmp_path: Path, formula: str
+) -> None:
+    """Test text inside string literals is not read as functions, cells or parens."""
+    test_file = create_test_workbook(tmp_path)
+
+    result = validate_formula_in_cell_operation(
+        filepath=test_file,
+        sheet_name=TEST_SHEET,
+        cell=TEST_CELL,
+        formula=formula,
+    )
+
+    assert result["status"] == "success"
+
+
+@pytest.mark.parametrize(
+    ("formula", "expected"),
+    [
+        ("=SUM(XFD1048576)", "success"),
+        ("=ATAN2(A1, B1) + LOG10(C1)", "success"),
+        ("=SUM(XFE1)", "error"),
+        ("=A0+1", "error"),
+        ("=SUM(A1:A1048577)", "error"),
+    ],
+)
+def test_validate_formula_in_cell_operation_reference_bounds(
+    tmp_path: Path, formula: str, expected: str
+) -> None:
+    """Test formula references are checked against the sheet limits."""
+    test_file = create_test_workbook(tmp_path)
+
+    result = validate_formula_in_cell_operation(
+        filepath=test_file, sheet_name=TEST_SHEET, cell=TEST_CELL, formula=formula
+    )
+
+    assert result["status"] == expected
+
+
+@pytest.mark.parametrize("formula", [None, 42, ["=SUM(A1)"]])
+def test_validate_formula_rejects_non_string(formula: object) -> None:
+    """Test non-string formulas are rejected, including unhashable ones."""
+    assert validate_formula(formula) == (False, "Formula must be a string")
+
+
+@pytest.mark.parametrize(
+    "formula",
+    ['=_XLFN.WEBSERVICE("http://x")', "=_XLFN.INDIRECT(A1)", "=SUM(_XLFN.RTD(A1))"],
+)
+def test_validate_formula_rejects_prefixed_unsafe_function(formula: str) -> None:
+    """Test unsafe functions are caught behind a dotted prefix."""
+    is_valid, message = validate_formula(formula)
+
+    assert is_valid is False
+    assert message.startswith("Unsafe function")
+
+
 # Tests for validate_formula_syntax (async wrapper)
-@pytest.mark.asyncio  # type: ignore[misc]
 async def test_validate_formula_syntax_valid(tmp_path: Path) -> None:
     """Test successful formula validation via async wrapper."""
     # Configure test environment
@@ -114,7 +176,6 @@ async def test_validate_formula_syntax_valid(tmp_path: Path) -> None:
     assert result["cell"] == TEST_CELL
 
 
-@pytest.mark.asyncio  # type: ignore[misc]
 async def test_validate_formula_syntax_invalid(tmp_path: Path) -> None:
     """Test validation of invalid formula via async wrapper."""
     # Configure test environment
@@ -134,12 +195,46 @@ async def test_validate_formula_syntax_invalid(tmp_path: Path) -> None:
     assert "Invalid formula syntax" in result["message"]
 
 
+async def test_validate_formula_syntax_rejects_malformed_cell() -> None:
+    """Test a malformed cell is rejected without opening the workbook."""
+    with patch(
+        "mcp_excel.tools.formulas_excel_tools.validate_formula_in_cell_operation"
+    ) as mock_validate:
+        result = await formulas_excel_tools.validate_formula_syntax(
+            filename="missing.xlsx",
+            sheet_name=TEST_SHEET,
+            cell="A0",
+            formula=TEST_FORMULA,
+        )
+
+    assert result["status"] == "error"
+    assert "Invalid cell reference" in result["message"]
+    mock_validate.assert_not_called()
+
+
+@pytest.mark.parametrize("formula", ["SUM(A1:A2)", "=SUM(A1:A2", "=SUM(A1))"])
+async def test_validate_formula_syntax_rejects_malformed_formula(formula: str) -> None:
+    """Test a malformed formula is rejected without opening the workbook."""
+    with patch(
+        "mcp_excel.tools.formulas_excel_tools.validate_formula_in_cell_operation"
+    ) as mock_load:
+        result = await formulas_excel_tools.validate_formula_syntax(
+            filename="missing.xlsx",
+            sheet_name=TEST_SHEET,
+            cell=TEST_CELL,
+            formula=formula,
+        )
+
+    assert result["status"] == "error"
+    assert "Invalid formula syntax" in result["message"]
+    mock_load.assert_not_called()
+
+
 # Tests for apply_formula_excel
 @patch(
     "mcp_excel.tools.formulas_excel_tools.validate_file_access",
-    lambda arg: (lambda f: f),
+    lambda arg: lambda f: f,
 )
-@pytest.mark.asyncio  # type: ignore[misc]
 async def test_apply_formula_success(tmp_path: Path) -> None:
     """Test successful formula application."""
     # Configure test environment
@@ -171,15 +266,19 @@ async def test_apply_formula_success(tmp_path: Path) -> None:
 
         # Verify apply_formula was called
         mock_apply.assert_called_once_with(
-            test_file, TEST_SHEET, TEST_CELL, TEST_FORMULA
+            test_file,
+            TEST_SHEET,
+            TEST_CELL,
+            TEST_FORMULA,
+            workbook=ANY,
+            pre_validated=True,
         )
 
 
 @patch(
     "mcp_excel.tools.formulas_excel_tools.validate_file_access",
-    lambda arg: (lambda f: f),
+    lambda arg: lambda f: f,
 )
-@pytest.mark.asyncio  # type: ignore[misc]
 async def test_apply_formula_validation_failure(tmp_path: Path) -> None:
     """Test formula application with invalid formula."""
     # Configure test environment
@@ -199,7 +298,6 @@ async def test_apply_formula_validation_failure(tmp_path: Path) -> None:
     assert "Invalid formula syntax" in result["message"]
 
 
-@pytest.mark.asyncio  # type: ignore[misc]
 async def test_apply_formula_real_integration(tmp_path: Path) -> None:
     """Integration test: apply formula to real workbook."""
     # Configure test environment
@@ -233,3 +331,104 @@ async def test_apply_formula_real_integration(tmp_path: Path) -> None:
     wb = load_workbook(test_file, data_only=False)
     ws = wb[TEST_SHEET]
     assert ws["A3"].value == "=A1+A2"
+
+
+async def test_apply_formula_concurrent_calls_on_one_file(tmp_path: Path) -> None:
+    """Test concurrent applies to one file are serialized and all saved."""
+    import asyncio
+
+    from openpyxl import load_workbook
+
+    manager = ConfigurationManager()
+    manager.reload_configuration(directory=str(tmp_path), log_level="INFO")
+
+    test_file = create_test_workbook(tmp_path)
+    cells = [f"B{row}" for row in range(1, 9)]
+
+    results = await asyncio.gather(
+        *(
+            formulas_excel_tools.apply_formula_excel(
+                filename=test_file,
+                sheet_name=TEST_SHEET,
+                cell=cell,
+                formula=f"=A{cell[1:]}*2",
+            )
+            for cell in cells
+        ),
+        formulas_excel_tools.apply_formulas_batch(
+            filename=test_file,
+            formulas=[{"sheet_name": TEST_SHEET, "cell": "C1", "formula": "=A1"}],
+        ),
+    )
+
+    assert [r["status"] for r in results] == ["success"] * (len(cells) + 1)
+    wb = load_workbook(test_file, data_only=False)
+    assert [wb[TEST_SHEET][cell].value for cell in cells] == [
+        f"=A{cell[1:]}*2" for cell in cells
+    ]
+    assert wb[TEST_SHEET]["C1"].value == "=A1"
+
+
+# Tests for apply_formulas_batch
+async def test_apply_formulas_batch_writes_all(tmp_path: Path) -> None:
+    """Test a batch of formulas is applied with one save."""
+    manager = ConfigurationManager()
+    manager.reload_configuration(directory=str(tmp_path), log_level="INFO")
+
+    test_file = create_test_workbook(tmp_path)
+
+    result = await formulas_excel_tools.apply_formulas_batch(
+        filename=test_file,
+        formulas=[
+            {"sheet_name": TEST_SHEET, "cell": "B1", "formula": "=A1*2"},
+            {"sheet_name": TEST_SHEET, "cell": "B2", "formula": "SUM(A1:A10)"},
+        ],
+    )
+
+    assert result["status"] == "success"
+    assert result["applied"] == 2
+
+    from openpyxl import load_workbook
+
+    wb = load_workbook(test_file, data_only=False)
+    assert wb[TEST_SHEET]["B1"].value == "=A1*2"
+    assert wb[TEST_SHEET]["B2"].value == "=SUM(A1:A10)"
+
+
+async def test_apply_formulas_batch_is_all_or_nothing(tmp_path: Path) -> None:
+    """Test no formula is written when one entry fails validation."""
+    manager = ConfigurationManager()
+    manager.reload_configuration(directory=str(tmp_path), log_level="INFO")
+
+    test_file = create_test_workbook(tmp_path)
+
+    result = await formulas_excel_tools.apply_formulas_batch(
+        filename=test_file,
+        formulas=[
+            {"sheet_name": TEST_SHEET, "cell": "B1", "formula": "=A1*2"},
+            {"sheet_name": TEST_SHEET, "cell": "B2", "formula": TEST_INVALID_FORMULA},
+        ],
+    )
+
+    assert result["status"] == "error"
+    assert [r["status"] for r in result["results"]] == ["success", "error"]
+
+    from openpyxl import load_workbook
+
+    wb = load_workbook(test_file, data_only=False)
+    assert wb[TEST_SHEET]["B1"].value is None
+
+
+async def test_apply_formulas_batch_missing_keys(tmp_path: Path) -> None:
+    """Test entries without the required keys are rejected."""
+    manager = ConfigurationManager()
+    manager.reload_configuration(directory=str(tmp_path), log_level="INFO")
+
+    test_file = create_test_workbook(tmp_path)
+
+    result = await formulas_excel_tools.apply_formulas_batch(
+        filename=test_file, formulas=[{"cell": "B1", "formula": "=A1"}]
+    )
+
+    assert result["status"] == "error"
+    assert "sheet_name" in result["message"]
@@ -1,8 +1,6 @@
 from pathlib import Path
 from unittest.mock import patch
 
-import pytest
-
 from mcp_excel.exceptions.exception_tools import ChartError, PivotError, ValidationError
 from mcp_excel.tools import graphics_tools
 from mcp_excel.config import ConfigurationManager
@@ -15,7 +13,6 @@ TEST_TARGET_CELL = "E5"
 
 
 # Test for create_chart
-@pytest.mark.asyncio  # type: ignore[misc]
 async def test_create_chart_success(tmp_path) -> None:
     """Test successful chart creation."""
     # Configure test environment
@@ -57,7 +54,6 @@ async def test_create_chart_success(tmp_path) -> None:
         )
 
 
-@pytest.mark.asyncio  # type: ignore[misc]
 async def test_create_chart_validation_error(tmp_path) -> None:
     """Test chart creation with validation error."""
     # Configure test environment
@@ -78,11 +74,10 @@ async def test_create_chart_validation_error(tmp_path) -> None:
             target_cell=TEST_TARGET_CELL,
         )
 
-        assert "error" in result
-        assert "Invalid chart type" in result["error"]
+        assert result["status"] == "error"
+        assert "Invalid chart type" in result["message"]
 
 
-@pytest.mark.asyncio  # type: ignore[misc]
 async def test_create_chart_chart_error(tmp_path) -> None:
     """Test chart creation with chart-specific error."""
     # Configure test environment
@@ -103,12 +98,11 @@ async def test_create_chart_chart_error(tmp_path) -> None:
             target_cell=TEST_TARGET_CELL,
         )
 
-        assert "error" in result
-        assert "Data range is empty" in result["error"]
+        assert result["status"] == "error"
+        assert "Data range is empty" in result["message"]
 
 
 # Test for create_pivot_table
-@pytest.mark.asyncio  # type: ignore[misc]
 async def test_create_pivot_table_success(tmp_path) -> None:
     """Test successful pivot table creation."""
     # Configure test environment
@@ -149,7 +143,6 @@ async def test_create_pivot_table_success(tmp_path) -> None:
         )
 
 
-@pytest.mark.asyncio  # type: ignore[misc]
 async def test_create_pivot_table_validation_error(tmp_path) -> None:
     """Test pivot table creation with validation error."""
     # Configure test environment
@@ -172,11 +165,10 @@ async def test_create_pivot_table_validation_error(tmp_path) -> None:
             values=["Sales"],
         )
 
-        assert "error" in result
-        assert "Invalid data range" in result["error"]
+        assert result["status"] == "error"
+        assert "Invalid data range" in result["message"]
 
 
-@pytest.mark.asyncio  # type: ignore[misc]
 async def test_create_pivot_table_pivot_error(tmp_path) -> None:
     """Test pivot table creation with pivot-specific error."""
     # Configure test environment
@@ -199,5 +191,5 @@ async def test_create_pivot_table_pivot_error(tmp_path) -> None:
             values=["NonNumericColumn"],
         )
 
-        assert "error" in result
-        assert "No numeric data" in result["error"]
+        assert result["status"] == "error"
+        assert "No numeric data" in result["message"]
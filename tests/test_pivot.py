@@ -10,6 +10,7 @@ from mcp_excel.core.pivot import (
     _convert_sheetdata_to_dicts,
     _get_combinations,
     _filter_data,
+    _group_records,
     _aggregate_values,
     create_pivot_table,
 )
@@ -174,6 +175,31 @@ class TestFilterData:
         assert len(result) == 2
 
 
+class TestGroupRecords:
+    """Tests for _group_records function."""
+
+    def test_groups_match_filter(self) -> None:
+        """Test each group holds the records _filter_data would select."""
+        data: list[dict[str, Any]] = [
+            {"Region": "North", "Product": "A", "Sales": 100},
+            {"Region": "South", "Product": "A", "Sales": 200},
+            {"Region": "North", "Product": "B", "Sales": 150},
+            {"Region": "North", "Product": "A", "Sales": 50},
+        ]
+
+        groups = _group_records(data, ["Region", "Product"])
+
+        assert groups[("North", "A")] == _filter_data(
+            data, {"Region": "North"}, {"Product": "A"}
+        )
+        assert groups[("South", "A")] == [data[1]]
+        assert ("South", "B") not in groups
+
+    def test_empty_data(self) -> None:
+        """Test grouping empty data."""
+        assert _group_records([], ["Region"]) == {}
+
+
 class TestAggregateValues:
     """Tests for _aggregate_values function."""
 
@@ -0,0 +1,25 @@
+"""Tests for mcp_excel.tools.register_tools module."""
+
+from mcp.server.fastmcp import FastMCP
+
+from mcp_excel.tools.register_tools import TOOL_REGISTRY, register_all_tools
+
+
+def test_registry_names_exist() -> None:
+    """Test every registered name is an async tool function of its module."""
+    import inspect
+
+    for module, names in TOOL_REGISTRY.values():
+        for name in names:
+            assert inspect.iscoroutinefunction(getattr(module, name)), name
+
+
+def test_register_all_tools() -> None:
+    """Test all tools from the registry end up on the server."""
+    mcp = FastMCP("test")
+
+    register_all_tools(mcp)
+
+    expected = {name for _, names in TOOL_REGISTRY.values() for name in names}
+    registered = {tool.name for tool in mcp._tool_manager.list_tools()}
+    assert registered == expected
@@ -0,0 +1,208 @@
+"""Tests for mcp_excel.core.session module."""
+
+import os
+import shutil
+from pathlib import Path
+
+import pytest
+from openpyxl import Workbook, load_workbook
+
+from mcp_excel.config import ConfigurationManager
+from mcp_excel.core import session as session_module
+from mcp_excel.core.calculations import apply_formula, apply_formulas_bulk
+from mcp_excel.core.formatting import format_range
+from mcp_excel.core.session import (
+    close_session,
+    commit_session,
+    get_session_workbook,
+    mark_session_dirty,
+    open_session,
+)
+from mcp_excel.exceptions.exception_core import (
+    FormulaError,
+    SessionError,
+    WorkbookError,
+)
+from mcp_excel.tools.formulas_excel_tools import apply_formula_excel
+from mcp_excel.utils.sheet_utils import merge_range
+
+
+@pytest.fixture
+def sample_file(tmp_path: Path) -> str:
+    """Create a small workbook to open sessions on."""
+    wb = Workbook()
+    ws = wb.active
+    ws.title = "Sheet1"
+    ws["A1"] = 1
+    ws["A2"] = 2
+    path = tmp_path / "session.xlsx"
+    wb.save(path)
+    wb.close()
+    return str(path)
+
+
+class TestWorkbookSession:
+    """Tests for the open/commit/close session lifecycle."""
+
+    def test_changes_are_written_on_commit(self, sample_file: str) -> None:
+        """Test edits stay in memory until the session is committed."""
+        session_id = open_session(sample_file)["session_id"]
+        try:
+            wb = get_session_workbook(session_id, sample_file)
+            apply_formula(sample_file, "Sheet1", "A3", "=SUM(A1:A2)", workbook=wb)
+            format_range(sample_file, "Sheet1", "A1", bold=True, workbook=wb)
+            merge_range(sample_file, "Sheet1", "B1", "C1", workbook=wb)
+            mark_session_dirty(session_id)
+
+            on_disk = load_workbook(sample_file)
+            assert on_disk["Sheet1"]["A3"].value is None
+            on_disk.close()
+
+            commit_session(session_id)
+
+            on_disk = load_workbook(sample_file)
+            ws = on_disk["Sheet1"]
+            assert ws["A3"].value == "=SUM(A1:A2)"
+            assert ws["A1"].font.bold
+            assert "B1:C1" in [str(r) for r in ws.merged_cells.ranges]
+            on_disk.close()
+        finally:
+            close_session(session_id, commit=False)
+
+    def test_close_discards_changes_without_commit(self, sample_file: str) -> None:
+        """Test closing with commit=False leaves the file untouched."""
+        session_id = open_session(sample_file)["session_id"]
+        wb = get_session_workbook(session_id, sample_file)
+        wb["Sheet1"]["A1"] = 100
+
+        close_session(session_id, commit=False)
+
+        on_disk = load_workbook(sample_file)
+        assert on_disk["Sheet1"]["A1"].value == 1
+        on_disk.close()
+        with pytest.raises(SessionError):
+            commit_session(session_id)
+
+    def test_unknown_session(self, sample_file: str) -> None:
+        """Test using an unknown session id raises SessionError."""
+        with pytest.raises(SessionError):
+            get_session_workbook("missing", sample_file)
+
+    def test_session_bound_to_file(self, sample_file: str, tmp_path: Path) -> None:
+        """Test a session cannot be used for a different file."""
+        session_id = open_session(sample_file)["session_id"]
+        try:
+            with pytest.raises(SessionError):
+                get_session_workbook(session_id, str(tmp_path / "other.xlsx"))
+        finally:
+            close_session(session_id)
+
+    def test_idle_session_is_committed(
+        self, sample_file: str, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test idle sessions are committed and dropped on the next access."""
+        session_id = open_session(sample_file)["session_id"]
+        wb = get_session_workbook(session_id, sample_file)
+        wb["Sheet1"]["A1"] = 42
+        mark_session_dirty(session_id)
+
+        monkeypatch.setattr(session_module, "SESSION_IDLE_TIMEOUT", -1.0)
+        other_id = open_session(sample_file)["session_id"]
+        close_session(other_id, commit=False)
+
+        on_disk = load_workbook(sample_file)
+        assert on_disk["Sheet1"]["A1"].value == 42
+        on_disk.close()
+        with pytest.raises(SessionError):
+            close_session(session_id)
+
+    def test_idle_session_save_failure_keeps_session(
+        self, sample_file: str, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test a failed idle commit keeps the session and expires the others."""
+        broken_file = tmp_path / "broken.xlsx"
+        shutil.copyfile(sample_file, broken_file)
+        broken_id = open_session(broken_file)["session_id"]
+        get_session_workbook(broken_id, broken_file)["Sheet1"]["A1"] = 1
+        mark_session_dirty(broken_id)
+        session_id = open_session(sample_file)["session_id"]
+        get_session_workbook(session_id, sample_file)["Sheet1"]["A1"] = 42
+        mark_session_dirty(session_id)
+
+        # A directory in place of the file makes the save fail
+        broken_file.unlink()
+        broken_file.mkdir()
+        monkeypatch.setattr(session_module, "SESSION_IDLE_TIMEOUT", -1.0)
+        other_id = open_session(sample_file)["session_id"]
+        close_session(other_id, commit=False)
+
+        on_disk = load_workbook(sample_file)
+        assert on_disk["Sheet1"]["A1"].value == 42
+        on_disk.close()
+        with pytest.raises(SessionError):
+            close_session(session_id)
+
+        # The failed session still holds its edits and reports the error
+        assert get_session_workbook(broken_id, broken_file)["Sheet1"]["A1"].value == 1
+        with pytest.raises(WorkbookError):
+            commit_session(broken_id)
+        close_session(broken_id, commit=False)
+
+    async def test_failed_operation_leaves_session_clean(
+        self, sample_file: str, test_config: ConfigurationManager
+    ) -> None:
+        """Test an operation that fails does not make commit rewrite the file."""
+        session_id = open_session(sample_file)["session_id"]
+        mtime = os.stat(sample_file).st_mtime_ns
+        try:
+            result = await apply_formula_excel(
+                sample_file, "Sheet1", "A3", "=SUM(A1:A2", session_id=session_id
+            )
+            assert result["status"] == "error"
+
+            commit_session(session_id)
+
+            assert os.stat(sample_file).st_mtime_ns == mtime
+        finally:
+            close_session(session_id, commit=False)
+
+    def test_commit_refuses_file_changed_on_disk(self, sample_file: str) -> None:
+        """Test a commit does not overwrite writes made outside the session."""
+        session_id = open_session(sample_file)["session_id"]
+        get_session_workbook(session_id, sample_file)["Sheet1"]["A1"] = 100
+        mark_session_dirty(session_id)
+
+        outside = load_workbook(sample_file)
+        outside["Sheet1"]["B1"] = "outside"
+        outside.save(sample_file)
+        outside.close()
+        # Make the change visible on filesystems with coarse timestamps
+        os.utime(sample_file, ns=(0, 0))
+
+        with pytest.raises(WorkbookError):
+            commit_session(session_id)
+        close_session(session_id, commit=False)
+
+        on_disk = load_workbook(sample_file)
+        assert on_disk["Sheet1"]["A1"].value == 1
+        assert on_disk["Sheet1"]["B1"].value == "outside"
+        on_disk.close()
+
+    def test_failed_batch_rolls_back_session_workbook(self, sample_file: str) -> None:
+        """Test a batch that fails while writing leaves no cell changed."""
+        session_id = open_session(sample_file)["session_id"]
+        try:
+            wb = get_session_workbook(session_id, sample_file)
+            wb["Sheet1"].merge_cells("C1:D1")
+
+            # D1 is covered by the merge, so writing it raises after B1 is set
+            with pytest.raises(FormulaError):
+                apply_formulas_bulk(
+                    sample_file,
+                    [("Sheet1", "B1", "=A1*2"), ("Sheet1", "D1", "=A1")],
+                    workbook=wb,
+                )
+
+            assert wb["Sheet1"]["B1"].value is None
+        finally:
+            close_session(session_id, commit=False)
@@ -1,6 +1,9 @@
 """Tests for mcp_excel.core.workbook module."""
 
+import zipfile
 from pathlib import Path
+from typing import Any
+from unittest.mock import patch
 
 import pytest
 from openpyxl import Workbook, load_workbook
@@ -199,6 +202,87 @@ class TestGetWorkbookInfo:
         assert result["used_ranges"] is not None
         assert "A1" in str(result["used_ranges"])
 
+    def test_get_workbook_info_sheet_order_and_refresh(self, tmp_path: Path) -> None:
+        """Test sheet names keep workbook order and reflect rewrites."""
+        test_file = tmp_path / "test.xlsx"
+        wb = Workbook()
+        wb.active.title = "Zeta"
+        wb.create_sheet("Alpha")
+        wb.save(test_file)
+        wb.close()
+
+        assert get_workbook_info(test_file)["sheets"] == ["Zeta", "Alpha"]
+
+        create_sheet(test_file, "Beta")
+
+        assert get_workbook_info(test_file)["sheets"] == ["Zeta", "Alpha", "Beta"]
+
+    @staticmethod
+    def _rewrite_package(source: Path, target: Path, edits: dict[str, Any]) -> None:
+        """Copy an xlsx package, renaming or editing the listed parts.
+
+        Each value is either the new part name or a function of the bytes.
+        """
+        with zipfile.ZipFile(source) as src, zipfile.ZipFile(target, "w") as dst:
+            for item in src.infolist():
+                data = src.read(item)
+                edit = edits.get(item.filename)
+                if isinstance(edit, str):
+                    dst.writestr(edit, data)
+                elif edit is not None:
+                    dst.writestr(item.filename, edit(data))
+                else:
+                    dst.writestr(item, data)
+
+    def _sample_file(self, tmp_path: Path) -> Path:
+        """Save a two-sheet workbook to rewrite."""
+        source = tmp_path / "source.xlsx"
+        wb = Workbook()
+        wb.active.title = "Zeta"
+        wb.create_sheet("Alpha")
+        wb.save(source)
+        wb.close()
+        return source
+
+    def test_get_workbook_info_workbook_part_from_rels(self, tmp_path: Path) -> None:
+        """Test the workbook part is located through _rels/.rels."""
+        test_file = tmp_path / "moved.xlsx"
+        self._rewrite_package(
+            self._sample_file(tmp_path),
+            test_file,
+            {
+                "xl/workbook.xml": "xl/main.xml",
+                "_rels/.rels": lambda data: data.replace(
+                    b"xl/workbook.xml", b"xl/main.xml"
+                ),
+            },
+        )
+
+        assert get_workbook_info(test_file)["sheets"] == ["Zeta", "Alpha"]
+
+    def test_get_workbook_info_strict_namespace(self, tmp_path: Path) -> None:
+        """Test sheet names are read from strict OOXML workbook parts."""
+        test_file = tmp_path / "strict.xlsx"
+        self._rewrite_package(
+            self._sample_file(tmp_path),
+            test_file,
+            {
+                "xl/workbook.xml": lambda data: data.replace(
+                    b"http://schemas.openxmlformats.org/spreadsheetml/2006/main",
+                    b"http://purl.oclc.org/ooxml/spreadsheetml/main",
+                )
+            },
+        )
+
+        assert get_workbook_info(test_file)["sheets"] == ["Zeta", "Alpha"]
+
+    def test_get_workbook_info_falls_back_to_openpyxl(self, tmp_path: Path) -> None:
+        """Test openpyxl is used when no sheet entries are recognized."""
+        test_file = self._sample_file(tmp_path)
+
+        with patch("mcp_excel.core.workbook._SHEET_TAGS", ()):
+            assert get_workbook_info(test_file)["sheets"] == ["Zeta", "Alpha"]
+
     def test_get_workbook_info_nonexistent_file(self, tmp_path: Path) -> None:
         """Test getting info for non-existent file raises error."""
         test_file = tmp_path / "nonexistent.xlsx"